@@ -5,48 +5,32 @@ Main entry point for the Streamlit Cloud deployment.
 This file must be at the root level for Streamlit Cloud to recognize it.
 """
 
+from typing import Any, Dict
+
 import streamlit as st
-from src.ui.pages.analysis_tab_enhanced import render_enhanced_analysis_tab
-from src.ui.pages.roster_tab_enhanced import render_enhanced_roster_tab
 from src.ui.components.styling_enhanced import apply_enhanced_css
-from src.ui.components.styling import create_section_header
 from src.ui.components.loading import inject_loading_css
-from src.core.config import get_config
-
-
-def main() -> None:
-    """Main application entry point."""
-    # Configure Streamlit page
-    st.set_page_config(
-        page_title="Yahoo Fantasy Baseball Analyzer",
-        page_icon="⚾",
-        layout="wide",
-        initial_sidebar_state="collapsed",
-        menu_items={
-            'Get Help': 'https://github.com/yourusername/yahoo-fantasy-baseball-streamlit',
-            'Report a bug': 'https://github.com/yourusername/yahoo-fantasy-baseball-streamlit/issues',
-            'About': """
-            # Yahoo Fantasy Baseball Analyzer
-            
-            Analyze your Yahoo Fantasy Baseball league for optimal Monday/Tuesday starter pickups.
-            
-            **Features:**
-            - Find confirmed probable starters for Monday/Tuesday
-            - Identify potential second starts
-            - Compare waiver wire vs. roster options
-            - Direct links to Baseball Savant player pages
-            
-            Built with Streamlit and powered by Yahoo Fantasy API and MLB Stats API.
-            """
-        }
-    )
-    
-    # Apply enhanced styling with dark mode and mobile support
-    apply_enhanced_css()
-    inject_loading_css()
-    
-    # Enhanced dark header with subtle effects and tab styling
-    st.markdown("""
+from src.api.yahoo_client import fetch_league_teams
+from src.core.config import ApplicationConfiguration, reload_config
+from src.core.exceptions import AuthenticationError
+
+
+# Yahoo game ID for the current MLB season (league keys look like "458.l.<id>")
+_YAHOO_GAME_ID = 458
+
+# Session state keys read by main() on every rerun
+_STATE_KEYS = (
+    'league_id',
+    'teams_loaded',
+    'teams_index',
+    'manual_entry',
+    'team_key',
+    'team_number',
+    'configured'
+)
+
+# Static header markup and styles, built once per process
+_HEADER_HTML = """
         <style>
         .app-header {
             background: linear-gradient(135deg, #1a1a1a 0%, #2a2a2a 100%);
@@ -176,11 +160,79 @@ def main() -> None:
             <div class="app-title">Yahoo Baseball Pitcher Streamer</div>
             <div class="app-desc">Find two-start starting pitchers on your waiver wire</div>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_config() -> ApplicationConfiguration:
+    """Build the application configuration once per process."""
+    return reload_config()
+
+
+def _update_state(state: Dict[str, Any], **changes: Any) -> None:
+    """Apply changes to the local state snapshot, writing back only what changed."""
+    for key, value in changes.items():
+        if state.get(key) != value:
+            state[key] = value
+            st.session_state[key] = value
+
+
+def _load_league_teams(state: Dict[str, Any], full_league_key: str) -> None:
+    """Load teams for a league into session state, falling back to manual entry."""
+    try:
+        with st.spinner("Loading teams..."):
+            teams_index = fetch_league_teams(full_league_key)
+
+        if teams_index['by_name']:
+            _update_state(state, teams_index=teams_index, teams_loaded=True)
+        else:
+            _update_state(state, teams_loaded=False)
+            st.warning("No teams found in this league")
+    except AuthenticationError:
+        st.error("Yahoo API not configured")
+    except Exception as e:
+        # Fallback to manual entry
+        _update_state(state, manual_entry=True)
+        st.warning(f"Could not load teams: {str(e)[:100]}")
+
+
+def main() -> None:
+    """Main application entry point."""
+    # Configure Streamlit page
+    st.set_page_config(
+        page_title="Yahoo Fantasy Baseball Analyzer",
+        page_icon="⚾",
+        layout="wide",
+        initial_sidebar_state="collapsed",
+        menu_items={
+            'Get Help': 'https://github.com/yourusername/yahoo-fantasy-baseball-streamlit',
+            'Report a bug': 'https://github.com/yourusername/yahoo-fantasy-baseball-streamlit/issues',
+            'About': """
+            # Yahoo Fantasy Baseball Analyzer
+            
+            Analyze your Yahoo Fantasy Baseball league for optimal Monday/Tuesday starter pickups.
+            
+            **Features:**
+            - Find confirmed probable starters for Monday/Tuesday
+            - Identify potential second starts
+            - Compare waiver wire vs. roster options
+            - Direct links to Baseball Savant player pages
+            
+            Built with Streamlit and powered by Yahoo Fantasy API and MLB Stats API.
+            """
+        }
+    )
+    
+    # Apply enhanced styling with dark mode and mobile support
+    apply_enhanced_css()
+    inject_loading_css()
+    
+    # Enhanced dark header with subtle effects and tab styling
+    st.html(_HEADER_HTML)
     
     # Initialize configuration
     try:
-        config = get_config()
+        config = _cached_config()
     except Exception as e:
         st.error(f"⚠️ Configuration error: {str(e)}")
         st.info("""
@@ -191,56 +243,41 @@ def main() -> None:
         """)
         st.stop()
 
+    # Snapshot session state once per rerun instead of going through the proxy
+    state = {key: st.session_state.get(key) for key in _STATE_KEYS}
+
     # Configuration section (mobile-friendly, no sidebar)
     # Step 1: League ID input
-    col1, col2 = st.columns([4, 1])
-
-    with col1:
-        league_id = st.text_input(
-            "League ID",
-            value=st.session_state.get('league_id', ''),
-            placeholder="e.g., 135626",
-            help="Your Yahoo Fantasy Baseball league ID",
-            key="input_league_id"
-        )
-
-    with col2:
-        st.markdown("<div style='height: 1px'></div>", unsafe_allow_html=True)
-        fetch_teams = st.button("Load League Teams", type="primary", use_container_width=True)
+    # Wrapped in a form so typing the ID doesn't rerun the script until submit
+    with st.form("league_config", clear_on_submit=False):
+        col1, col2 = st.columns([4, 1], vertical_alignment="bottom")
+
+        with col1:
+            league_id = st.text_input(
+                "League ID",
+                value=state['league_id'] or '',
+                placeholder="e.g., 135626",
+                help="Your Yahoo Fantasy Baseball league ID",
+                key="input_league_id"
+            )
+
+        with col2:
+            submitted = st.form_submit_button("Load League Teams", type="primary", use_container_width=True)
 
     # Step 2: Team selection (only shown after league ID is entered)
-    if fetch_teams and league_id:
-        st.session_state['league_id'] = league_id
-        st.session_state['fetch_teams'] = True
-        st.rerun()
-
-    # Try to load teams if league ID is set
-    if st.session_state.get('league_id') and st.session_state.get('fetch_teams', False):
-        try:
-            from src.api.yahoo_client import YahooFantasyClient
-
-            with st.spinner("Loading teams..."):
-                client = YahooFantasyClient()
-                if client.is_configured():
-                    full_league_key = f"458.l.{st.session_state['league_id']}"
-                    teams_dict = client.get_league_teams(full_league_key)
-
-                    if teams_dict:
-                        st.session_state['teams_dict'] = teams_dict
-                        st.session_state['teams_loaded'] = True
-                    else:
-                        st.warning("No teams found in this league")
-                else:
-                    st.error("Yahoo API not configured")
-        except Exception as e:
-            # Fallback to manual entry
-            st.session_state['manual_entry'] = True
-            st.warning(f"Could not load teams: {str(e)[:100]}")
+    if submitted and league_id:
+        _update_state(state, league_id=league_id)
+
+    league_id = state['league_id']
+    full_league_key = f"{_YAHOO_GAME_ID}.l.{league_id}" if league_id else None
+
+    if submitted and full_league_key:
+        _load_league_teams(state, full_league_key)
 
     # Show team selector if teams are loaded
-    if st.session_state.get('teams_loaded') and st.session_state.get('teams_dict'):
-        teams_dict = st.session_state['teams_dict']
-        team_options = ["Select your team..."] + list(teams_dict.values())
+    if state['teams_loaded'] and state['teams_index']:
+        teams_index = state['teams_index']
+        team_options = ["Select your team...", *teams_index['names']]
 
         selected_team = st.selectbox(
             "Your Team",
@@ -249,35 +286,40 @@ def main() -> None:
         )
 
         if selected_team and selected_team != "Select your team...":
-            # Find the team key for the selected team
-            for key, name in teams_dict.items():
-                if name == selected_team:
-                    team_key = key
-                    # Extract team number from key (e.g., "458.l.135626.t.6" -> "6")
-                    team_number = team_key.split('.t.')[-1]
-
-                    st.session_state['team_key'] = team_key
-                    st.session_state['team_number'] = team_number
-                    st.session_state['configured'] = True
-                    break
+            # Team key and number (e.g., "458.l.135626.t.6" -> "6") are precomputed
+            team_key, team_number = teams_index['by_name'][selected_team]
+
+            _update_state(
+                state,
+                team_key=team_key,
+                team_number=team_number,
+                configured=True
+            )
+
+        if st.button("Refresh teams"):
+            fetch_league_teams.clear()
+            _load_league_teams(state, full_league_key)
+            st.rerun()
 
     # Fallback: Manual team number entry (only if API fails)
-    elif st.session_state.get('manual_entry') or (st.session_state.get('league_id') and not st.session_state.get('teams_loaded')):
+    elif state['manual_entry'] or (full_league_key and not state['teams_loaded']):
         team_number = st.text_input(
             "Team Number (manual entry)",
-            value=st.session_state.get('team_number', ''),
+            value=state['team_number'] or '',
             placeholder="e.g., 6",
             help="Enter your team number manually",
             key="manual_team_number"
         )
 
         if team_number:
-            full_league_key = f"458.l.{st.session_state['league_id']}"
             team_key = f"{full_league_key}.t.{team_number}"
 
-            st.session_state['team_key'] = team_key
-            st.session_state['team_number'] = team_number
-            st.session_state['configured'] = True
+            _update_state(
+                state,
+                team_key=team_key,
+                team_number=team_number,
+                configured=True
+            )
 
     # Help expander (collapsed by default)
     with st.expander("📖 Help & Tips", expanded=False):
@@ -299,21 +341,17 @@ def main() -> None:
             - Team 1, Team 2, etc.
             """)
 
-    # Minimal spacing after help section
-    st.markdown("<div style='height: 1px'></div>", unsafe_allow_html=True)
-
-    # Check if configured
-    is_configured = st.session_state.get('configured', False)
-        
-
-    
     # Main application tabs with enhanced styling
     tab1, tab2 = st.tabs(["Analysis", "Roster"])
     
+    # Tab modules pull in pandas; import them only once the tabs render.
+    # Each tab shows its own placeholder until a team is selected.
     with tab1:
+        from src.ui.pages.analysis_tab_enhanced import render_enhanced_analysis_tab
         render_enhanced_analysis_tab()
     
     with tab2:
+        from src.ui.pages.roster_tab_enhanced import render_enhanced_roster_tab
         render_enhanced_roster_tab()
     
 
@@ -9,6 +9,7 @@ Run this script once to get your tokens, then add them to secrets.toml
 """
 
 import os
+import re
 import sys
 from yahoo_oauth import OAuth2
 
@@ -82,11 +83,15 @@ def update_secrets_file(client_id, client_secret, access_token, refresh_token):
         with open(secrets_path, 'r') as f:
             content = f.read()
         
-        # Replace placeholder values
-        content = content.replace('REPLACE_WITH_YOUR_CLIENT_ID', client_id)
-        content = content.replace('REPLACE_WITH_YOUR_CLIENT_SECRET', client_secret)
-        content = content.replace('REPLACE_WITH_YOUR_ACCESS_TOKEN', access_token)
-        content = content.replace('REPLACE_WITH_YOUR_REFRESH_TOKEN', refresh_token)
+        # Replace placeholder values in a single pass
+        replacements = {
+            'REPLACE_WITH_YOUR_CLIENT_ID': client_id,
+            'REPLACE_WITH_YOUR_CLIENT_SECRET': client_secret,
+            'REPLACE_WITH_YOUR_ACCESS_TOKEN': access_token,
+            'REPLACE_WITH_YOUR_REFRESH_TOKEN': refresh_token,
+        }
+        pattern = re.compile('|'.join(map(re.escape, replacements)))
+        content = pattern.sub(lambda m: replacements[m.group(0)], content)
         
         # Write back to file
         with open(secrets_path, 'w') as f:
@@ -3,11 +3,26 @@ API client classes for external service integration.
 """
 
 from .base_client import BaseAPIClient
-from .mlb_client import MLBStatsClient
-from .yahoo_client import YahooFantasyClient
+from .async_base_client import AsyncBaseAPIClient, run_sync
+from .mlb_client import MLBStatsClient, get_mlb_client, fetch_probable_starters
+from .yahoo_client import (
+    YahooFantasyClient,
+    get_yahoo_client,
+    fetch_league_teams,
+    fetch_team_roster,
+    fetch_waiver_players
+)
 
 __all__ = [
     "BaseAPIClient",
+    "AsyncBaseAPIClient",
+    "run_sync",
     "MLBStatsClient", 
-    "YahooFantasyClient"
+    "YahooFantasyClient",
+    "get_mlb_client",
+    "fetch_probable_starters",
+    "get_yahoo_client",
+    "fetch_league_teams",
+    "fetch_team_roster",
+    "fetch_waiver_players"
 ]
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+Async API client using httpx with HTTP/2 for concurrent requests.
+
+Optional: requires ``httpx[http2]`` (``pip install "httpx[http2]"``).
+"""
+
+import asyncio
+import logging
+from typing import Any, Coroutine, Dict, List, Optional, TypeVar
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .base_client import handle_api_response
+from ..core.exceptions import NetworkError, TimeoutError
+from ..core.constants import API_REQUEST_TIMEOUT
+
+T = TypeVar('T')
+
+
+class AsyncBaseAPIClient:
+    """
+    Async counterpart of BaseAPIClient for fanning out many requests.
+
+    Requests share one HTTP/2 connection per host and are capped by a
+    semaphore sized to the connection limit. Use as an async context
+    manager so the underlying client is bound to the running event loop:
+
+        async with AsyncBaseAPIClient(MLB_STATS_BASE_URL) as client:
+            teams, schedule = await client.get_many(["teams", "schedule"])
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = API_REQUEST_TIMEOUT,
+        max_connections: int = 20,
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Initialize async API client.
+
+        Args:
+            base_url: Base URL for API endpoints
+            timeout: Request timeout in seconds
+            max_connections: Maximum connections and in-flight requests
+            headers: Default headers for requests
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncBaseAPIClient requires httpx: pip install 'httpx[http2]'"
+            )
+
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.default_headers = {
+            'User-Agent': 'Yahoo-Fantasy-Baseball-Streamlit/1.0',
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        }
+        if headers:
+            self.default_headers.update(headers)
+
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._request_count = 0
+
+    async def __aenter__(self) -> "AsyncBaseAPIClient":
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.default_headers,
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=self.max_connections)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_connections)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request with error handling.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint or absolute URL
+            params: Query parameters
+            data: Request body data
+            headers: Additional headers
+            timeout: Request timeout override
+
+        Returns:
+            Parsed response data
+
+        Raises:
+            NetworkError: For network-related errors
+            TimeoutError: For timeout errors
+            APIError: For API-specific errors
+        """
+        if self._client is None:
+            raise RuntimeError("AsyncBaseAPIClient must be used with 'async with'")
+
+        url = endpoint if endpoint.startswith(('http://', 'https://')) else endpoint.lstrip('/')
+        request_timeout = timeout or self.timeout
+        self._request_count += 1
+
+        try:
+            async with self._semaphore:
+                response = await self._client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=data,
+                    headers=headers,
+                    timeout=request_timeout
+                )
+
+            return handle_api_response(response, endpoint, self.logger)
+
+        except httpx.TimeoutException as e:
+            error_msg = f"Request timeout after {request_timeout}s for {endpoint}"
+            self.logger.error(error_msg)
+            raise TimeoutError(error_msg, e)
+
+        except httpx.HTTPError as e:
+            error_msg = f"Request failed for {endpoint}"
+            self.logger.error(f"{error_msg}: {e}")
+            raise NetworkError(error_msg, e)
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Make GET request."""
+        return await self._make_request("GET", endpoint, params=params, headers=headers, timeout=timeout)
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Make POST request."""
+        return await self._make_request("POST", endpoint, params=params, data=data, headers=headers, timeout=timeout)
+
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Make PUT request."""
+        return await self._make_request("PUT", endpoint, params=params, data=data, headers=headers, timeout=timeout)
+
+    async def delete(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Make DELETE request."""
+        return await self._make_request("DELETE", endpoint, params=params, headers=headers, timeout=timeout)
+
+    async def get_many(
+        self,
+        endpoints: List[str],
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Make concurrent GET requests.
+
+        Args:
+            endpoints: API endpoints to fetch
+            params: Query parameters applied to every request
+
+        Returns:
+            Parsed response data, in the same order as endpoints
+        """
+        return await asyncio.gather(*(self.get(endpoint, params=params) for endpoint in endpoints))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client statistics."""
+        return {
+            "base_url": self.base_url,
+            "request_count": self._request_count,
+            "timeout": self.timeout,
+            "max_connections": self.max_connections
+        }
+
+    async def close(self) -> None:
+        """Close the client and clean up resources."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self.logger.debug("Async API client closed")
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous (Streamlit) code.
+
+    Pass a coroutine object, e.g. ``run_sync(fetch_all())`` where
+    ``fetch_all`` is an ``async def`` that gathers inside itself. Don't pass
+    ``asyncio.gather(...)`` built in sync code: that future would be bound to
+    a different loop than the one created here.
+
+    Args:
+        coroutine: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    return asyncio.run(coroutine)
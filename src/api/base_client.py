@@ -3,22 +3,171 @@ Base API client with error handling, retry logic, and timeout management.
 """
 
 import logging
+import random
+import socket
+import threading
 import time
-from typing import Dict, Any, Optional, Union
+from functools import lru_cache, partial
+from typing import Callable, Dict, Any, Optional, Tuple, Union
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
 from ..core.exceptions import (
     APIError, NetworkError, TimeoutError, RateLimitError,
     create_error_response
 )
+from ..utils.json_utils import json_dumps, json_loads
 from ..core.constants import (
     MAX_API_RETRIES, API_REQUEST_TIMEOUT, RATE_LIMIT_DELAY,
-    HTTP_STATUS_CODES
+    HTTP_STATUS_CODES, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
 )
 
 
+# Sessions shared by every client with the same base URL and retry policy,
+# so connection pools survive Streamlit reruns that rebuild clients
+_SESSION_CACHE: Dict[Tuple[str, int, bool], requests.Session] = {}
+_SESSION_CACHE_LOCK = threading.Lock()
+
+
+class _JitteredRetry(Retry):
+    """
+    Retry policy with decorrelated-jitter backoff.
+    
+    Each sleep is drawn from [backoff_factor, 3 * previous sleep] and capped,
+    so concurrent clients spread out instead of retrying in lockstep. A
+    server-sent Retry-After header still takes precedence (urllib3 default).
+    """
+    
+    BACKOFF_CAP = 30.0
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._prev_backoff = 0.0
+    
+    def new(self, **kwargs: Any) -> "_JitteredRetry":
+        retry = super().new(**kwargs)
+        retry._prev_backoff = self._prev_backoff
+        return retry
+    
+    def get_backoff_time(self) -> float:
+        # Keep urllib3's behaviour of not sleeping before the first retry
+        if super().get_backoff_time() <= 0:
+            return 0
+        
+        base = self.backoff_factor
+        self._prev_backoff = min(
+            self.BACKOFF_CAP,
+            random.uniform(base, max(self._prev_backoff, base) * 3)
+        )
+        return self._prev_backoff
+
+
+@lru_cache(maxsize=512)
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Join an endpoint onto a base URL; absolute URLs pass through unchanged."""
+    if endpoint[:7] == 'http://' or endpoint[:8] == 'https://':
+        return endpoint
+    return base_url + '/' + endpoint.lstrip('/')
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that enables TCP keep-alive probes on pooled connections.
+    
+    urllib3's default socket options (TCP_NODELAY) are kept, so idle pooled
+    connections stay usable without reintroducing Nagle delays.
+    """
+    
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Bytes of an error body kept for diagnostics
+_ERROR_BODY_LIMIT = 2000
+
+
+def _body_snippet(response: Any, limit: int) -> str:
+    """Decode only the first `limit` bytes of a response body."""
+    return response.content[:limit].decode('utf-8', errors='replace')
+
+
+def handle_api_response(response: Any, endpoint: str, logger: logging.Logger) -> Dict[str, Any]:
+    """
+    Handle API response and convert to standardized format.
+    
+    Shared by the sync and async clients; works with both requests and
+    httpx responses.
+    
+    Args:
+        response: HTTP response object
+        endpoint: API endpoint that was called
+        logger: Logger of the calling client
+        
+    Returns:
+        Parsed response data
+        
+    Raises:
+        APIError: For various API error conditions
+    """
+    # Log response details (skip the timing lookup unless DEBUG is on)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Response: %s for %s (took %.2fs)",
+            response.status_code, endpoint, response.elapsed.total_seconds()
+        )
+    
+    # Handle rate limiting
+    if response.status_code == HTTP_STATUS_CODES["TOO_MANY_REQUESTS"]:
+        retry_after = int(response.headers.get('Retry-After', 60))
+        raise RateLimitError(
+            f"Rate limit exceeded for {endpoint}",
+            retry_after=retry_after,
+            status_code=response.status_code
+        )
+    
+    # Handle client errors (4xx)
+    if 400 <= response.status_code < 500:
+        error_msg = f"Client error {response.status_code} for {endpoint}"
+        try:
+            error_data = json_loads(response.content)
+            if 'error' in error_data:
+                error_msg += f": {error_data['error']}"
+        except (ValueError, KeyError):
+            error_msg += f": {_body_snippet(response, 200)}"
+        
+        raise APIError(
+            error_msg, response.status_code,
+            {"response_text": _body_snippet(response, _ERROR_BODY_LIMIT)}
+        )
+    
+    # Handle server errors (5xx)
+    if response.status_code >= 500:
+        error_msg = f"Server error {response.status_code} for {endpoint}"
+        raise APIError(
+            error_msg, response.status_code,
+            {"response_text": _body_snippet(response, _ERROR_BODY_LIMIT)}
+        )
+    
+    # Handle successful responses
+    if response.status_code == HTTP_STATUS_CODES["OK"]:
+        try:
+            return json_loads(response.content)
+        except ValueError as e:
+            logger.warning(f"Failed to parse JSON response from {endpoint}: {e}")
+            return {"raw_response": response.text}
+    
+    # Handle other successful status codes
+    return {"status_code": response.status_code, "response": response.text}
+
+
 class BaseAPIClient:
     """
     Base class for API clients with common functionality.
@@ -29,15 +178,26 @@ class BaseAPIClient:
     - Timeout management
     - Structured error handling
     - Request/response logging
+    
+    get/post/put/delete are bound to _make_request per instance and take
+    the endpoint positionally, everything else by keyword.
     """
     
+    get: Callable[..., Dict[str, Any]]
+    post: Callable[..., Dict[str, Any]]
+    put: Callable[..., Dict[str, Any]]
+    delete: Callable[..., Dict[str, Any]]
+    
     def __init__(
         self,
         base_url: str,
         timeout: int = API_REQUEST_TIMEOUT,
         max_retries: int = MAX_API_RETRIES,
         rate_limit_delay: float = RATE_LIMIT_DELAY,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        burst: int = 5,
+        retry_post: bool = False,
+        warmup: bool = True
     ) -> None:
         """
         Initialize base API client.
@@ -46,13 +206,20 @@ class BaseAPIClient:
             base_url: Base URL for API endpoints
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
-            rate_limit_delay: Delay between retries in seconds
+            rate_limit_delay: Average delay between requests in seconds
             headers: Default headers for requests
+            burst: Number of requests allowed back-to-back before throttling
+            retry_post: Also retry POST requests (only for idempotent APIs)
+            warmup: Open a pooled connection in the background when a new
+                session is created
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
         self.rate_limit_delay = rate_limit_delay
+        self.burst = burst
+        self.retry_post = retry_post
+        self.warmup = warmup
         
         # Set up logging
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -69,119 +236,114 @@ class BaseAPIClient:
         if headers:
             self.default_headers.update(headers)
         
-        # Rate limiting tracking
-        self._last_request_time = 0.0
+        # Prebuilt once; requests copies headers when preparing, so it is never mutated
+        self._default_headers_frozen = CaseInsensitiveDict(self.default_headers)
+        
+        # Rate limiting tracking: token bucket kept as a theoretical arrival
+        # time in integer monotonic nanoseconds (GCRA)
+        self._interval_ns = int(rate_limit_delay * 1_000_000_000)
+        self._burst_tolerance_ns = max(burst - 1, 0) * self._interval_ns
+        self._tat_ns = 0
+        self._rate_limit_lock = threading.Lock()
         self._request_count = 0
+        
+        # HTTP verb helpers dispatch straight to _make_request
+        self.get = partial(self._make_request, "GET")
+        self.post = partial(self._make_request, "POST")
+        self.put = partial(self._make_request, "PUT")
+        self.delete = partial(self._make_request, "DELETE")
     
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry configuration."""
-        session = requests.Session()
+        """Get the shared requests session for this base URL and retry policy."""
+        key = (self.base_url, self.max_retries, self.retry_post)
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-            backoff_factor=1,
-            raise_on_status=False
-        )
+        with _SESSION_CACHE_LOCK:
+            session = _SESSION_CACHE.get(key)
+            if session is not None:
+                return session
+            
+            session = requests.Session()
+            
+            allowed_methods = ["HEAD", "GET", "OPTIONS"]
+            if self.retry_post:
+                allowed_methods.append("POST")
+            
+            # Configure retry strategy (429s honour Retry-After before backing off)
+            retry_strategy = _JitteredRetry(
+                total=self.max_retries,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=allowed_methods,
+                backoff_factor=1,
+                raise_on_status=False
+            )
+            
+            # Mount adapter with retry strategy
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            
+            _SESSION_CACHE[key] = session
         
-        # Mount adapter with retry strategy
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        if self.warmup:
+            threading.Thread(
+                target=self._warm_up_connection, args=(session,), daemon=True
+            ).start()
         
         return session
     
+    def _warm_up_connection(self, session: requests.Session) -> None:
+        """Complete the TCP/TLS handshake ahead of the first real request."""
+        try:
+            session.head(self.base_url, timeout=3, allow_redirects=False)
+        except requests.exceptions.RequestException as e:
+            self.logger.debug("Connection warm-up failed: %s", e)
+    
     def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
+        """Enforce rate limiting: bursts of `burst` requests, then one per rate_limit_delay."""
+        if self._interval_ns <= 0:
+            self._request_count += 1
+            return
         
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        # Reserve a slot under the lock so concurrent callers queue up behind
+        # each other, then sleep without holding it
+        with self._rate_limit_lock:
+            self._request_count += 1
+            now = time.monotonic_ns()
+            tat = max(self._tat_ns, now)
+            allowed_at = tat - self._burst_tolerance_ns
+            self._tat_ns = tat + self._interval_ns
         
-        self._last_request_time = time.time()
-        self._request_count += 1
+        if now < allowed_at:
+            sleep_time = (allowed_at - now) / 1_000_000_000
+            self.logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
+            time.sleep(sleep_time)
     
     def _prepare_url(self, endpoint: str) -> str:
         """Prepare full URL from endpoint."""
-        if endpoint.startswith(('http://', 'https://')):
-            return endpoint
-        
-        endpoint = endpoint.lstrip('/')
-        return f"{self.base_url}/{endpoint}"
+        return _join_url(self.base_url, endpoint)
     
-    def _prepare_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Prepare request headers."""
-        request_headers = self.default_headers.copy()
-        if headers:
-            request_headers.update(headers)
+    def _prepare_headers(self, headers: Optional[Dict[str, str]] = None) -> CaseInsensitiveDict:
+        """Prepare request headers, sharing the defaults when there is nothing to add."""
+        if not headers:
+            return self._default_headers_frozen
+        
+        request_headers = self._default_headers_frozen.copy()
+        request_headers.update(headers)
         return request_headers
     
     def _handle_response(self, response: requests.Response, endpoint: str) -> Dict[str, Any]:
-        """
-        Handle API response and convert to standardized format.
-        
-        Args:
-            response: HTTP response object
-            endpoint: API endpoint that was called
-            
-        Returns:
-            Parsed response data
-            
-        Raises:
-            APIError: For various API error conditions
-        """
-        # Log response details
-        self.logger.debug(
-            f"Response: {response.status_code} for {endpoint} "
-            f"(took {response.elapsed.total_seconds():.2f}s)"
-        )
-        
-        # Handle rate limiting
-        if response.status_code == HTTP_STATUS_CODES["TOO_MANY_REQUESTS"]:
-            retry_after = int(response.headers.get('Retry-After', 60))
-            raise RateLimitError(
-                f"Rate limit exceeded for {endpoint}",
-                retry_after=retry_after,
-                status_code=response.status_code
-            )
-        
-        # Handle client errors (4xx)
-        if 400 <= response.status_code < 500:
-            error_msg = f"Client error {response.status_code} for {endpoint}"
-            try:
-                error_data = response.json()
-                if 'error' in error_data:
-                    error_msg += f": {error_data['error']}"
-            except (ValueError, KeyError):
-                error_msg += f": {response.text[:200]}"
-            
-            raise APIError(error_msg, response.status_code, {"response_text": response.text})
-        
-        # Handle server errors (5xx)
-        if response.status_code >= 500:
-            error_msg = f"Server error {response.status_code} for {endpoint}"
-            raise APIError(error_msg, response.status_code, {"response_text": response.text})
-        
-        # Handle successful responses
-        if response.status_code == HTTP_STATUS_CODES["OK"]:
-            try:
-                return response.json()
-            except ValueError as e:
-                self.logger.warning(f"Failed to parse JSON response from {endpoint}: {e}")
-                return {"raw_response": response.text}
-        
-        # Handle other successful status codes
-        return {"status_code": response.status_code, "response": response.text}
+        """Handle API response and convert to standardized format."""
+        return handle_api_response(response, endpoint, self.logger)
     
     def _make_request(
         self,
         method: str,
         endpoint: str,
+        *,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -214,16 +376,17 @@ class BaseAPIClient:
         self._enforce_rate_limit()
         
         # Log request details
-        self.logger.debug(f"Making {method} request to {url}")
-        if params:
-            self.logger.debug(f"Query params: {params}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Making %s request to %s", method, url)
+            if params:
+                self.logger.debug("Query params: %s", params)
         
         try:
             response = self.session.request(
                 method=method,
                 url=url,
                 params=params,
-                json=data,
+                data=json_dumps(data) if data is not None else None,
                 headers=request_headers,
                 timeout=request_timeout
             )
@@ -245,48 +408,6 @@ class BaseAPIClient:
             self.logger.error(f"{error_msg}: {e}")
             raise NetworkError(error_msg, e)
     
-    def get(
-        self,
-        endpoint: str,
-        params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """Make GET request."""
-        return self._make_request("GET", endpoint, params=params, headers=headers, timeout=timeout)
-    
-    def post(
-        self,
-        endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """Make POST request."""
-        return self._make_request("POST", endpoint, params=params, data=data, headers=headers, timeout=timeout)
-    
-    def put(
-        self,
-        endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """Make PUT request."""
-        return self._make_request("PUT", endpoint, params=params, data=data, headers=headers, timeout=timeout)
-    
-    def delete(
-        self,
-        endpoint: str,
-        params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """Make DELETE request."""
-        return self._make_request("DELETE", endpoint, params=params, headers=headers, timeout=timeout)
-    
     def health_check(self) -> bool:
         """
         Perform basic health check on the API.
@@ -295,8 +416,13 @@ class BaseAPIClient:
             True if API is accessible
         """
         try:
-            # Try a simple request to the base URL
-            response = self.session.get(self.base_url, timeout=5)
+            # HEAD avoids transferring a body; fall back to a 1-byte ranged GET
+            # for servers that don't allow HEAD
+            response = self.session.head(self.base_url, timeout=5, allow_redirects=False)
+            if response.status_code == 405:
+                response = self.session.get(
+                    self.base_url, timeout=5, headers={'Range': 'bytes=0-0'}
+                )
             return response.status_code < 500
         except Exception as e:
             self.logger.warning(f"Health check failed: {e}")
@@ -309,11 +435,21 @@ class BaseAPIClient:
             "request_count": self._request_count,
             "timeout": self.timeout,
             "max_retries": self.max_retries,
-            "rate_limit_delay": self.rate_limit_delay
+            "rate_limit_delay": self.rate_limit_delay,
+            "burst": self.burst
         }
     
     def close(self) -> None:
-        """Close the session and clean up resources."""
+        """
+        Close the session and clean up resources.
+        
+        The session is shared with other clients for the same base URL, so it
+        is also dropped from the shared cache and the next client starts fresh.
+        """
         if self.session:
+            with _SESSION_CACHE_LOCK:
+                key = (self.base_url, self.max_retries, self.retry_post)
+                if _SESSION_CACHE.get(key) is self.session:
+                    del _SESSION_CACHE[key]
             self.session.close()
             self.logger.debug("API client session closed")
\ No newline at end of file
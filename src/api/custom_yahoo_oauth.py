@@ -5,13 +5,22 @@ This module provides a custom OAuth implementation that bypasses the issues
 with the yahoo_oauth library by directly using the tokens without re-authentication.
 """
 
-import json
+import os
 import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from requests_oauthlib import OAuth1Session
 import requests
 
+from .base_client import KeepAliveAdapter
+from ..core.constants import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+from ..utils.json_utils import json_loads
+
+
+# Parsed credential files keyed by path, as (mtime, data); an edited file
+# replaces its entry so stale secrets aren't kept around
+_CRED_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
 class CustomYahooOAuth:
     """
@@ -41,14 +50,23 @@ class CustomYahooOAuth:
         self.token_time: float = time.time()
         self.token_expiry: float = time.time() + 3600  # 1 hour from now
         
+        # Reused across requests so the TLS connection stays warm
+        self._session: Optional[OAuth1Session] = None
+        
         # Load credentials
         self._load_credentials()
     
     def _load_credentials(self) -> None:
-        """Load OAuth credentials from the JSON file."""
+        """Load OAuth credentials from the JSON file, reparsing only when it changes."""
         try:
-            with open(self.oauth_file, 'r') as f:
-                oauth_data = json.load(f)
+            mtime = os.stat(self.oauth_file).st_mtime
+            cached = _CRED_CACHE.get(self.oauth_file)
+            if cached is not None and cached[0] == mtime:
+                oauth_data = cached[1]
+            else:
+                with open(self.oauth_file, 'rb') as f:
+                    oauth_data = json_loads(f.read())
+                _CRED_CACHE[self.oauth_file] = (mtime, oauth_data)
             
             self.consumer_key = oauth_data.get('consumer_key')
             self.consumer_secret = oauth_data.get('consumer_secret')
@@ -93,15 +111,21 @@ class CustomYahooOAuth:
     
     def get_oauth_session(self) -> OAuth1Session:
         """
-        Create an OAuth1Session for making authenticated requests.
+        Get the OAuth1Session for making authenticated requests.
+        
+        The session is created on first use with a pooled HTTPS adapter
+        and reused for the lifetime of this client.
         
         Returns:
             Configured OAuth1Session instance
         """
+        if self._session is not None:
+            return self._session
+        
         if not self.token_is_valid():
             raise ValueError("OAuth token is not valid")
         
-        return OAuth1Session(
+        session = OAuth1Session(
             client_key=self.consumer_key,
             client_secret=self.consumer_secret,
             resource_owner_key=self.access_token,
@@ -109,6 +133,18 @@ class CustomYahooOAuth:
             signature_method='HMAC-SHA1',
             signature_type='AUTH_HEADER'
         )
+        session.mount('https://', KeepAliveAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE
+        ))
+        self._session = session
+        return session
+    
+    def close(self) -> None:
+        """Close the pooled OAuth session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     def make_request(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
         """
@@ -159,9 +195,6 @@ class YahooFantasyAPIWrapper:
         # Additional attributes that yahoo_fantasy_api might expect
         self.oauth_version = '1.0a'
         self.signature_method = 'HMAC-SHA1'
-        
-        # Create the session object that yahoo_fantasy_api uses
-        self._session = None
     
     def token_is_valid(self) -> bool:
         """Check if token is valid."""
@@ -173,10 +206,17 @@ class YahooFantasyAPIWrapper:
     
     @property
     def session(self) -> OAuth1Session:
-        """Get the OAuth session for making requests."""
-        if self._session is None:
-            self._session = self.oauth_client.get_oauth_session()
-        return self._session
+        """
+        Get the OAuth session for making requests.
+        
+        Always read through the client, which owns and caches the session,
+        so a close() there is never followed by use of the closed session.
+        """
+        return self.oauth_client.get_oauth_session()
+    
+    def close(self) -> None:
+        """Close the underlying OAuth session."""
+        self.oauth_client.close()
     
     def get(self, url: str, **kwargs) -> requests.Response:
         """Make a GET request using the OAuth session."""
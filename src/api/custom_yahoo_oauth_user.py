@@ -5,14 +5,27 @@ This module provides OAuth functionality that accepts user-provided credentials
 instead of using shared app credentials.
 """
 
+import hashlib
 import logging
-from typing import Dict, Optional, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
+import requests
 from requests_oauthlib import OAuth1Session
 import streamlit as st
 
+from .base_client import KeepAliveAdapter
+from ..core.constants import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+from ..utils.json_utils import json_loads
 from ..core.exceptions import AuthenticationError
 
 
+# Credential fields a user must provide, in a stable order
+_CREDENTIAL_FIELDS = ('client_id', 'client_secret', 'access_token', 'refresh_token')
+_REQUIRED = frozenset(_CREDENTIAL_FIELDS)
+
+
 class UserYahooOAuth:
     """
     Yahoo OAuth client that uses user-provided credentials.
@@ -22,6 +35,11 @@ class UserYahooOAuth:
     """
 
     YAHOO_BASE_URL = "https://fantasysports.yahooapis.com/fantasy/v2"
+    MAX_CONCURRENT_REQUESTS = 8
+    TOKEN_LIFETIME_SECONDS = 3600
+    TOKEN_EXPIRY_SKEW_SECONDS = 100
+    RESPONSE_CACHE_TTL_SECONDS = 60
+    RESPONSE_CACHE_MAXSIZE = 128
 
     def __init__(self, user_credentials: Optional[Dict[str, str]] = None) -> None:
         """
@@ -45,17 +63,30 @@ class UserYahooOAuth:
             )
 
         # Validate credentials
-        required_fields = ['client_id', 'client_secret', 'access_token', 'refresh_token']
-        missing = [f for f in required_fields if f not in self.credentials or not self.credentials[f]]
+        missing = _REQUIRED - {key for key, value in self.credentials.items() if value}
 
         if missing:
             raise AuthenticationError(
-                f"Missing OAuth credentials: {', '.join(missing)}"
+                f"Missing OAuth credentials: {', '.join(f for f in _CREDENTIAL_FIELDS if f in missing)}"
             )
 
         # Store credentials (never in instance variables for security)
         self._init_session()
 
+        # Assume a fresh token; expired ones still surface as 401s in get()
+        self._expires_at = (
+            time.monotonic() + self.TOKEN_LIFETIME_SECONDS - self.TOKEN_EXPIRY_SKEW_SECONDS
+        )
+
+        # Worker threads share the pooled session for get_many()
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS)
+
+        # Recent GET response bodies: (endpoint, params) -> (fetched_at, raw JSON).
+        # Raw bytes are kept so each hit decodes a fresh dict for its caller.
+        self._response_cache: Dict[Tuple[str, str], Tuple[float, bytes]] = {}
+        # One client can be shared by every session with the same credentials
+        self._response_cache_lock = threading.Lock()
+
     def _init_session(self) -> None:
         """Initialize OAuth session with user credentials."""
         try:
@@ -66,6 +97,10 @@ class UserYahooOAuth:
                 resource_owner_secret=self.credentials['refresh_token'],
                 signature_method='HMAC-SHA1'
             )
+            self.session.mount('https://', KeepAliveAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE
+            ))
         except Exception as e:
             raise AuthenticationError(f"Failed to initialize OAuth session: {str(e)}")
 
@@ -73,8 +108,20 @@ class UserYahooOAuth:
         """
         Check if the current token is valid.
 
+        This is a local expiry check; use validate_remote() to test the
+        token against the Yahoo API.
+
+        Returns:
+            True if token has not reached its expected expiry
+        """
+        return time.monotonic() < self._expires_at
+
+    def validate_remote(self) -> bool:
+        """
+        Check the token with a test call to the Yahoo API.
+
         Returns:
-            True if token is valid
+            True if Yahoo accepts the token
         """
         try:
             # Test with a simple API call
@@ -106,6 +153,10 @@ class UserYahooOAuth:
         """
         Make authenticated GET request to Yahoo API.
 
+        Identical requests within RESPONSE_CACHE_TTL_SECONDS are answered
+        from memory without signing or sending a new request. Each call gets
+        its own decoded copy, so callers can't see each other's changes.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
@@ -116,24 +167,88 @@ class UserYahooOAuth:
         Raises:
             AuthenticationError: If request fails
         """
+        cache_key = (endpoint, repr(sorted(params.items())) if params else '')
+        now = time.monotonic()
+        with self._response_cache_lock:
+            cached = self._response_cache.get(cache_key)
+        if cached and now - cached[0] < self.RESPONSE_CACHE_TTL_SECONDS:
+            return json_loads(cached[1])
+
         url = f"{self.YAHOO_BASE_URL}/{endpoint}"
 
         try:
             response = self.session.get(url, params=params)
-
-            if response.status_code == 401:
-                # Token might be expired
-                st.error("Authentication failed. Please check your OAuth credentials.")
-                raise AuthenticationError("Yahoo OAuth token expired or invalid")
-
-            response.raise_for_status()
-            return response.json()
+            data = self._parse_response(response)
+            self._cache_response(cache_key, now, response.content)
+            return data
 
         except Exception as e:
             if isinstance(e, AuthenticationError):
                 raise
             raise AuthenticationError(f"API request failed: {str(e)}")
 
+    def _cache_response(self, cache_key: Tuple[str, str], now: float, content: bytes) -> None:
+        """Store a response body, dropping expired entries and then the oldest if full."""
+        cache = self._response_cache
+        with self._response_cache_lock:
+            cache.pop(cache_key, None)
+            if len(cache) >= self.RESPONSE_CACHE_MAXSIZE:
+                cutoff = now - self.RESPONSE_CACHE_TTL_SECONDS
+                for key in [key for key, (fetched_at, _) in cache.items() if fetched_at <= cutoff]:
+                    del cache[key]
+                if len(cache) >= self.RESPONSE_CACHE_MAXSIZE:
+                    del cache[next(iter(cache))]
+            cache[cache_key] = (now, content)
+
+    def get_many(
+        self,
+        endpoints: List[str],
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Make concurrent authenticated GET requests to Yahoo API.
+
+        Requests run in parallel on the shared session; responses are
+        parsed on the calling thread so Streamlit messages still render.
+
+        Args:
+            endpoints: API endpoint paths
+            params: Query parameters applied to every request
+
+        Returns:
+            JSON response data, in the same order as endpoints
+
+        Raises:
+            AuthenticationError: If any request fails
+        """
+        futures = [
+            self._executor.submit(self.session.get, f"{self.YAHOO_BASE_URL}/{endpoint}", params=params)
+            for endpoint in endpoints
+        ]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(self._parse_response(future.result()))
+            except Exception as e:
+                if isinstance(e, AuthenticationError):
+                    raise
+                raise AuthenticationError(f"API request failed: {str(e)}")
+
+        return results
+
+    def _parse_response(self, response: requests.Response) -> Dict[str, Any]:
+        """Check a Yahoo API response for errors and return its JSON body."""
+        if response.status_code == 401:
+            # Token might be expired; don't serve anything fetched with it
+            with self._response_cache_lock:
+                self._response_cache.clear()
+            st.error("Authentication failed. Please check your OAuth credentials.")
+            raise AuthenticationError("Yahoo OAuth token expired or invalid")
+
+        response.raise_for_status()
+        return json_loads(response.content)
+
 
 class UserOAuth2Wrapper:
     """
@@ -150,8 +265,8 @@ class UserOAuth2Wrapper:
         self.consumer_secret = self.oauth_client.credentials.get('client_secret')
         self.access_token = self.oauth_client.credentials.get('access_token')
         self.refresh_token = self.oauth_client.credentials.get('refresh_token')
-        self.token_time = 0.0
-        self.access_token_lifetime = 3600
+        self.token_time = time.time()
+        self.access_token_lifetime = UserYahooOAuth.TOKEN_LIFETIME_SECONDS
 
     def token_is_valid(self) -> bool:
         """Check if token is valid."""
@@ -161,15 +276,25 @@ class UserOAuth2Wrapper:
         """Refresh access token."""
         return self.oauth_client.refresh_access_token()
 
+    @property
     def session(self) -> OAuth1Session:
         """Get OAuth session."""
         return self.oauth_client.session
 
 
+@st.cache_resource(show_spinner=False, ttl=UserYahooOAuth.TOKEN_LIFETIME_SECONDS)
+def _build_wrapper(cred_hash: str, _credentials: Dict[str, str]) -> UserOAuth2Wrapper:
+    """Build an OAuth wrapper once per credential set (keyed by cred_hash only)."""
+    return UserOAuth2Wrapper(_credentials)
+
+
 def get_user_oauth_client() -> Optional[UserOAuth2Wrapper]:
     """
     Get user-specific OAuth client from session state.
 
+    Wrappers are reused across reruns for the same credentials, so the
+    OAuth session and its connection pool are only built once.
+
     Returns:
         OAuth client or None if not configured
     """
@@ -178,8 +303,13 @@ def get_user_oauth_client() -> Optional[UserOAuth2Wrapper]:
     if not credentials:
         return None
 
+    cred_hash = hashlib.blake2b(
+        '\0'.join(str(credentials.get(field, '')) for field in _CREDENTIAL_FIELDS).encode('utf-8'),
+        digest_size=16
+    ).hexdigest()
+
     try:
-        return UserOAuth2Wrapper(credentials)
+        return _build_wrapper(cred_hash, credentials)
     except Exception as e:
         st.error(f"Failed to initialize OAuth client: {str(e)}")
-        return None
\ No newline at end of file
+        return None
@@ -3,15 +3,45 @@ MLB Stats API client for retrieving baseball data.
 """
 
 import logging
-from datetime import date, datetime, timedelta
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-import pandas as pd
+import streamlit as st
 
 from .base_client import BaseAPIClient
-from ..core.constants import MLB_STATS_BASE_URL, MLB_SPORT_ID
+from ..core.constants import MLB_STATS_BASE_URL, MLB_SPORT_ID, MLB_API_RATE_LIMIT
 from ..core.exceptions import MLBAPIError, DataValidationError
 from ..models.team import MLBTeam
 
+# Shared read-only default for missing nested objects in API payloads
+_EMPTY: Dict[str, Any] = {}
+
+# Field filters for schedule requests. The hydrated schedule carries venue,
+# status, and full team records per game; trimming to what is read below
+# keeps multi-week responses small to download and decode.
+PROBABLE_STARTERS_FIELDS = (
+    "dates,date,games,teams,home,away,probablePitcher,id,fullName,team,name"
+)
+TEAM_SCHEDULE_FIELDS = "dates,date,games,gamePk"
+
+
+def _team_from_dict(team_data: Dict[str, Any]) -> MLBTeam:
+    """
+    Build an MLBTeam from a Stats API team record.
+    
+    Uses model_construct: the record's field types come straight from the
+    API, so per-field validation would only repeat work on every team.
+    """
+    return MLBTeam.model_construct(
+        team_id=team_data['id'],
+        name=team_data['name'],
+        abbreviation=team_data.get('abbreviation'),
+        division=(team_data.get('division') or _EMPTY).get('name'),
+        league=(team_data.get('league') or _EMPTY).get('name')
+    )
+
 
 class MLBStatsClient(BaseAPIClient):
     """
@@ -24,17 +54,34 @@ class MLBStatsClient(BaseAPIClient):
     - Team data and standings
     """
     
+    PROBABLE_STARTERS_TTL_SECONDS = 600
+    SCHEDULE_FETCH_WORKERS = 8
+    
     def __init__(self) -> None:
         """Initialize MLB Stats API client."""
+        # Pace to the Stats API's per-minute limit rather than the generic
+        # 2s delay, and let a full round of schedule workers go out at once
         super().__init__(
             base_url=MLB_STATS_BASE_URL,
             timeout=10,
-            max_retries=3
+            max_retries=3,
+            rate_limit_delay=60 / MLB_API_RATE_LIMIT,
+            burst=self.SCHEDULE_FETCH_WORKERS
         )
         self.logger = logging.getLogger(__name__)
         
-        # Cache for team schedules (matches notebook implementation)
-        self._team_schedule_cache: Dict[Tuple[int, str, str], List[date]] = {}
+        # Cache for team schedules (matches notebook implementation):
+        # (team_id, start ordinal, end ordinal) -> game dates
+        self._team_schedule_cache: Dict[Tuple[int, int, int], List[date]] = {}
+        
+        # All 30 teams from one teams request, keyed by team ID
+        self._teams_by_id: Dict[int, MLBTeam] = {}
+        
+        # Probable starters change during the day, so entries expire:
+        # (start_str, end_str) -> (fetched_at, starters)
+        self._probable_starters_cache: Dict[
+            Tuple[str, str], Tuple[float, Dict[int, Dict[str, Any]]]
+        ] = {}
     
     def get_probable_starters(
         self, 
@@ -65,63 +112,72 @@ class MLBStatsClient(BaseAPIClient):
         Raises:
             MLBAPIError: If API request fails
         """
+        start_str = start_date.isoformat()
+        end_str = end_date.isoformat()
+        cache_key = (start_str, end_str)
+        
+        cached = self._probable_starters_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.PROBABLE_STARTERS_TTL_SECONDS:
+            return cached[1]
+        
         try:
-            start_str = start_date.isoformat()
-            end_str = end_date.isoformat()
-            
             self.logger.info(f"Fetching probable starters from {start_str} to {end_str}")
             
-            # Build API endpoint with hydration (matches notebook)
-            endpoint = (
-                f"schedule?sportId={MLB_SPORT_ID}"
-                f"&startDate={start_str}"
-                f"&endDate={end_str}"
-                f"&hydrate=probablePitcher,team"
-            )
-            
-            response_data = self.get(endpoint)
+            # Schedule request with hydration (matches notebook)
+            response_data = self.get("schedule", params={
+                "sportId": MLB_SPORT_ID,
+                "startDate": start_str,
+                "endDate": end_str,
+                "hydrate": "probablePitcher,team",
+                "fields": PROBABLE_STARTERS_FIELDS
+            })
             
             confirmed_starters = {}
+            add_starter = confirmed_starters.setdefault
             
             if not response_data.get('dates'):
                 self.logger.warning("No dates found in MLB API response")
                 return confirmed_starters
             
+            start_ordinal = start_date.toordinal()
+            end_ordinal = end_date.toordinal()
+            
             for day_data in response_data['dates']:
-                game_date_str = day_data['date']
-                game_date = datetime.strptime(game_date_str, '%Y-%m-%d').date()
+                games = day_data.get('games')
+                if not games:
+                    continue
+                
+                game_date = date.fromisoformat(day_data['date'])
                 
                 # Only include games within our target date range
-                if not (start_date <= game_date <= end_date):
+                if not (start_ordinal <= game_date.toordinal() <= end_ordinal):
                     continue
                 
-                for game in day_data.get('games', []):
+                for game in games:
                     # Process both home and away probable pitchers
-                    for team_key in ['home', 'away']:
-                        team_data = game.get('teams', {}).get(team_key, {})
-                        probable_pitcher = team_data.get('probablePitcher')
+                    teams = game.get('teams', _EMPTY)
+                    for team_data in (teams.get('home', _EMPTY), teams.get('away', _EMPTY)):
+                        # Unannounced starters (common several days out) have no
+                        # probablePitcher; skip them before touching team data
+                        if not (probable_pitcher := team_data.get('probablePitcher')):
+                            continue
+                        
                         team_info = team_data.get('team')
                         
-                        if (probable_pitcher and 
-                            'id' in probable_pitcher and 
+                        if ('id' in probable_pitcher and 
                             'fullName' in probable_pitcher and
                             team_info and 'id' in team_info):
                             
-                            pitcher_id = probable_pitcher['id']
-                            pitcher_name = probable_pitcher['fullName']
-                            team_id = team_info['id']
-                            team_name = team_info.get('name', 'Unknown Team')
-                            
                             # Store pitcher info (avoid duplicates by using pitcher_id as key)
-                            if pitcher_id not in confirmed_starters:
-                                confirmed_starters[pitcher_id] = {
-                                    'name': pitcher_name,
-                                    'date': game_date,
-                                    'team_id': team_id,
-                                    'team_name': team_name
-                                }
+                            add_starter(probable_pitcher['id'], {
+                                'name': probable_pitcher['fullName'],
+                                'date': game_date,
+                                'team_id': team_info['id'],
+                                'team_name': team_info.get('name', 'Unknown Team')
+                            })
             
             self.logger.info(f"Found {len(confirmed_starters)} confirmed probable starters")
+            self._probable_starters_cache[cache_key] = (time.monotonic(), confirmed_starters)
             return confirmed_starters
             
         except Exception as e:
@@ -145,42 +201,44 @@ class MLBStatsClient(BaseAPIClient):
             Dictionary with 'dates' key containing schedule data
         """
         try:
-            start_date_obj = datetime.strptime(start_date, '%Y-%m-%d').date()
-            end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
+            start_date_obj = date.fromisoformat(start_date)
+            end_date_obj = date.fromisoformat(end_date)
             
             # Get probable starters
             starters = self.get_probable_starters(start_date_obj, end_date_obj)
             
+            # Index starters by date once instead of rescanning them for each day
+            starters_by_date: Dict[date, List[Tuple[int, Dict[str, Any]]]] = defaultdict(list)
+            for pitcher_id, starter_info in starters.items():
+                starters_by_date[starter_info['date']].append((pitcher_id, starter_info))
+            
             # Convert to expected format for analysis service
             dates = []
             current_date = start_date_obj
             
             while current_date <= end_date_obj:
-                date_games = []
+                day_starters = starters_by_date.get(current_date)
                 
-                # Find all starters for this date
-                for pitcher_id, starter_info in starters.items():
-                    if starter_info['date'] == current_date:
-                        # Create game structure expected by analysis service
-                        game = {
-                            'teams': {
-                                'home': {
-                                    'probablePitcher': {
-                                        'id': pitcher_id,
-                                        'fullName': starter_info['name']
-                                    },
-                                    'team': {
-                                        'id': starter_info['team_id']
+                if day_starters:
+                    # Create game structure expected by analysis service
+                    dates.append({
+                        'date': current_date.isoformat(),
+                        'games': [
+                            {
+                                'teams': {
+                                    'home': {
+                                        'probablePitcher': {
+                                            'id': pitcher_id,
+                                            'fullName': starter_info['name']
+                                        },
+                                        'team': {
+                                            'id': starter_info['team_id']
+                                        }
                                     }
                                 }
                             }
-                        }
-                        date_games.append(game)
-                
-                if date_games:
-                    dates.append({
-                        'date': current_date.isoformat(),
-                        'games': date_games
+                            for pitcher_id, starter_info in day_starters
+                        ]
                     })
                 
                 current_date += timedelta(days=1)
@@ -213,40 +271,43 @@ class MLBStatsClient(BaseAPIClient):
         Raises:
             MLBAPIError: If API request fails
         """
-        # Check cache first (matches notebook implementation)
+        # Check cache first (matches notebook implementation); date ordinals
+        # keep the key all-int so hits never format ISO strings
+        cache_key = (team_id, start_date.toordinal(), end_date.toordinal())
+        
+        cached = self._team_schedule_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Using cached schedule for team %s", team_id)
+            return cached
+        
         start_str = start_date.isoformat()
         end_str = end_date.isoformat()
-        cache_key = (team_id, start_str, end_str)
-        
-        if cache_key in self._team_schedule_cache:
-            self.logger.debug(f"Using cached schedule for team {team_id}")
-            return self._team_schedule_cache[cache_key]
         
         try:
             self.logger.debug(f"Fetching schedule for team {team_id} from {start_str} to {end_str}")
             
-            endpoint = (
-                f"schedule?sportId={MLB_SPORT_ID}"
-                f"&teamId={team_id}"
-                f"&startDate={start_str}"
-                f"&endDate={end_str}"
-            )
-            
-            response_data = self.get(endpoint)
+            response_data = self.get("schedule", params={
+                "sportId": MLB_SPORT_ID,
+                "teamId": team_id,
+                "startDate": start_str,
+                "endDate": end_str,
+                "fields": TEAM_SCHEDULE_FIELDS
+            })
             
             game_dates = []
             
             if response_data.get('dates'):
                 for date_info in response_data['dates']:
-                    game_date = datetime.strptime(date_info['date'], '%Y-%m-%d').date()
+                    game_date = date.fromisoformat(date_info['date'])
                     
-                    # Check if there are actual games on this date
-                    if (date_info.get('games') and 
-                        any(g.get('gamePk') for g in date_info['games'])):
+                    # Check if there are actual games on this date; the API only
+                    # lists game entries on game days, so the first one suffices
+                    games = date_info.get('games')
+                    if games and games[0].get('gamePk'):
                         game_dates.append(game_date)
             
-            # Sort dates and cache result
-            game_dates.sort()
+            # The schedule endpoint lists dates chronologically, so the
+            # dates are already sorted; cache result
             self._team_schedule_cache[cache_key] = game_dates
             
             self.logger.debug(f"Found {len(game_dates)} games for team {team_id}")
@@ -257,11 +318,51 @@ class MLBStatsClient(BaseAPIClient):
                 raise
             raise MLBAPIError(f"Failed to fetch team schedule for team {team_id}: {str(e)}")
     
+    def get_team_schedules_bulk(
+        self,
+        team_ids: List[int],
+        start_date: date,
+        end_date: date
+    ) -> Dict[int, List[date]]:
+        """
+        Get schedules for several teams at once, fetching uncached ones in parallel.
+        
+        Each result lands in the team schedule cache, so later
+        get_team_schedule calls for the same range are cache hits.
+        
+        Args:
+            team_ids: MLB team IDs
+            start_date: Schedule start date
+            end_date: Schedule end date
+            
+        Returns:
+            Dictionary mapping team IDs to their game dates; teams whose
+            schedule could not be fetched are omitted
+        """
+        schedules: Dict[int, List[date]] = {}
+        if not team_ids:
+            return schedules
+        
+        unique_ids = list(dict.fromkeys(team_ids))
+        with ThreadPoolExecutor(max_workers=min(self.SCHEDULE_FETCH_WORKERS, len(unique_ids))) as executor:
+            futures = {
+                executor.submit(self.get_team_schedule, team_id, start_date, end_date): team_id
+                for team_id in unique_ids
+            }
+            for future, team_id in futures.items():
+                try:
+                    schedules[team_id] = future.result()
+                except MLBAPIError as e:
+                    self.logger.warning(f"Could not fetch schedule for team {team_id}: {e}")
+        
+        return schedules
+    
     def check_potential_second_start(
         self, 
         team_id: int, 
         first_start_date: date, 
-        fantasy_week_end_date: date
+        fantasy_week_end_date: date,
+        fantasy_week_start_date: Optional[date] = None
     ) -> bool:
         """
         Check if pitcher has potential for second start based on team schedule.
@@ -272,26 +373,39 @@ class MLBStatsClient(BaseAPIClient):
             team_id: MLB team ID
             first_start_date: Date of first confirmed start
             fantasy_week_end_date: End date of fantasy week
+            fantasy_week_start_date: Start of fantasy week; when given, the
+                schedule is fetched for the whole week so every pitcher on
+                the team shares one cached request
             
         Returns:
             True if pitcher likely has second start opportunity
         """
-        if not team_id or pd.isna(team_id):
+        if not team_id:
             return False
         
         try:
+            # int() rejects None-like and NaN IDs with TypeError/ValueError
             team_id_int = int(team_id)
+        except (TypeError, ValueError):
+            return False
+        
+        try:
             
             # Look for games starting day after first start
             schedule_start_date = first_start_date + timedelta(days=1)
+            if fantasy_week_start_date:
+                schedule_start_date = min(fantasy_week_start_date, schedule_start_date)
             # Look ahead beyond fantasy week for team's next 5 games
             schedule_end_date = fantasy_week_end_date + timedelta(days=5)
             
-            game_dates = self.get_team_schedule(
-                team_id_int, 
-                schedule_start_date, 
-                schedule_end_date
-            )
+            game_dates = [
+                game_date for game_date in self.get_team_schedule(
+                    team_id_int, 
+                    schedule_start_date, 
+                    schedule_end_date
+                )
+                if game_date > first_start_date
+            ]
             
             # If team has 5+ games, check if 5th game falls within fantasy week
             if len(game_dates) >= 5:
@@ -308,32 +422,18 @@ class MLBStatsClient(BaseAPIClient):
         """
         Get detailed team information.
         
+        Served from the all-teams listing, which is fetched once per client.
+        
         Args:
             team_id: MLB team ID
             
         Returns:
             MLBTeam object or None if not found
         """
-        try:
-            endpoint = f"teams/{team_id}"
-            response_data = self.get(endpoint)
-            
-            if not response_data.get('teams'):
-                return None
-            
-            team_data = response_data['teams'][0]
-            
-            return MLBTeam(
-                team_id=team_data['id'],
-                name=team_data['name'],
-                abbreviation=team_data.get('abbreviation'),
-                division=team_data.get('division', {}).get('name'),
-                league=team_data.get('league', {}).get('name')
-            )
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to get team info for {team_id}: {e}")
-            return None
+        if not self._teams_by_id:
+            self.get_all_teams()
+        
+        return self._teams_by_id.get(team_id)
     
     def get_all_teams(self) -> List[MLBTeam]:
         """
@@ -342,20 +442,14 @@ class MLBStatsClient(BaseAPIClient):
         Returns:
             List of MLBTeam objects
         """
+        if self._teams_by_id:
+            return list(self._teams_by_id.values())
+        
         try:
-            endpoint = f"teams?sportId={MLB_SPORT_ID}"
-            response_data = self.get(endpoint)
+            response_data = self.get("teams", params={"sportId": MLB_SPORT_ID})
             
-            teams = []
-            for team_data in response_data.get('teams', []):
-                team = MLBTeam(
-                    team_id=team_data['id'],
-                    name=team_data['name'],
-                    abbreviation=team_data.get('abbreviation'),
-                    division=team_data.get('division', {}).get('name'),
-                    league=team_data.get('league', {}).get('name')
-                )
-                teams.append(team)
+            teams = [_team_from_dict(team_data) for team_data in response_data.get('teams', [])]
+            self._teams_by_id = {team.team_id: team for team in teams}
             
             return teams
             
@@ -387,13 +481,54 @@ class MLBStatsClient(BaseAPIClient):
             return None
     
     def clear_cache(self) -> None:
-        """Clear the team schedule cache."""
+        """Clear the team schedule, probable starters, and teams caches."""
         self._team_schedule_cache.clear()
+        self._probable_starters_cache.clear()
+        self._teams_by_id.clear()
         self.logger.info("MLB client cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         return {
             "cached_schedules": len(self._team_schedule_cache),
-            "cache_keys": list(self._team_schedule_cache.keys())
-        }
\ No newline at end of file
+            "cache_keys": list(self._team_schedule_cache.keys()),
+            "cached_probable_starters": len(self._probable_starters_cache),
+            "cached_teams": len(self._teams_by_id)
+        }
+
+
+@st.cache_resource(show_spinner=False)
+def get_mlb_client() -> MLBStatsClient:
+    """
+    Get the shared MLB Stats API client for this process.
+
+    Returns:
+        MLBStatsClient instance reused across Streamlit reruns and sessions
+    """
+    return MLBStatsClient()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_probable_starters(
+    _client: MLBStatsClient,
+    start_date: date,
+    end_date: date
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Get probable starters for a date range, cached for ten minutes.
+
+    The client argument is excluded from the cache key; failed requests
+    raise and are therefore never cached.
+
+    Args:
+        _client: MLB Stats API client used on a cache miss
+        start_date: Start date for probable starters
+        end_date: End date for probable starters
+
+    Returns:
+        Dictionary mapping MLB player IDs to pitcher information
+
+    Raises:
+        MLBAPIError: If API request fails
+    """
+    return _client.get_probable_starters(start_date, end_date)
@@ -6,15 +6,53 @@ for use in generating Baseball Savant links and profile images.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import shelve
+import threading
+import time
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 from functools import lru_cache
 import unicodedata
 import re
 
+from ..core.constants import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+from ..utils.json_utils import json_loads
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive session shared by all lookups so repeat calls skip the TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=HTTP_POOL_CONNECTIONS,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+MLB_PEOPLE_SEARCH_URL = "https://statsapi.mlb.com/api/v1/people/search"
+
+# MLB IDs keyed by the name as searched; filled by single and batch lookups
+_PLAYER_ID_CACHE: Dict[str, Optional[int]] = {}
+
+# Player info keyed by the name as searched. Like the ID cache, only answers
+# from the API (including "not found") are stored; failed requests are not,
+# so a transient error is retried on the next lookup.
+_PLAYER_INFO_CACHE: Dict[str, Optional[Dict[str, Any]]] = {}
+PLAYER_INFO_CACHE_MAXSIZE = 500
+
+# Persistent lookup cache so restarts don't repeat searches for known names
+PLAYER_DISK_CACHE_PATH = Path(".cache") / "mlb_players"
+PLAYER_DISK_CACHE_TTL = 86400  # 1 day
+_DISK_CACHE_LOCK = threading.Lock()
+_MISSING = object()
+
 
+_NON_NAME_CHARS_RE = re.compile(r'[^a-z0-9\s]')
+
+
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize a player name for matching."""
     if not name:
@@ -22,13 +60,70 @@ def normalize_name(name: str) -> str:
     # Remove accents
     name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
     # Convert to lowercase and remove non-alphanumeric
-    name = re.sub(r'[^a-z0-9\s]', '', name.lower())
+    name = _NON_NAME_CHARS_RE.sub('', name.lower())
     # Remove extra spaces
     name = ' '.join(name.split())
     return name
 
 
-@lru_cache(maxsize=500)
+def _disk_cache_get(key: str) -> Any:
+    """Return an unexpired value from the disk cache, or _MISSING."""
+    try:
+        with _DISK_CACHE_LOCK, shelve.open(str(PLAYER_DISK_CACHE_PATH), flag='r') as cache:
+            entry = cache.get(key)
+    except Exception:
+        # No cache file yet, or it is unreadable
+        return _MISSING
+    
+    if entry is None or entry[0] < time.time():
+        return _MISSING
+    return entry[1]
+
+
+def _disk_cache_set(key: str, value: Any) -> None:
+    """Store a value in the disk cache with the default expiry."""
+    _disk_cache_set_many({key: value})
+
+
+def _disk_cache_set_many(items: Dict[str, Any]) -> None:
+    """Store several values in the disk cache with one open of the shelve file."""
+    if not items:
+        return
+    try:
+        PLAYER_DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        expires_at = time.time() + PLAYER_DISK_CACHE_TTL
+        with _DISK_CACHE_LOCK, shelve.open(str(PLAYER_DISK_CACHE_PATH)) as cache:
+            for key, value in items.items():
+                cache[key] = (expires_at, value)
+    except Exception as e:
+        logger.debug(f"Could not write {len(items)} player cache entries: {e}")
+
+
+def _cached_player_id(player_name: str) -> Any:
+    """Look up a player ID in memory, then on disk; returns _MISSING if unknown."""
+    cached = _PLAYER_ID_CACHE.get(player_name, _MISSING)
+    if cached is not _MISSING:
+        return cached
+    
+    player_id = _disk_cache_get(f"id:{normalize_name(player_name)}")
+    if player_id is not _MISSING:
+        _PLAYER_ID_CACHE[player_name] = player_id
+    return player_id
+
+
+def _remember_player_id(player_name: str, player_id: Optional[int]) -> None:
+    """Record a resolved player ID in memory and on disk."""
+    _remember_player_ids({player_name: player_id})
+
+
+def _remember_player_ids(player_ids: Dict[str, Optional[int]]) -> None:
+    """Record several resolved player IDs in memory and in one disk write."""
+    _PLAYER_ID_CACHE.update(player_ids)
+    _disk_cache_set_many({
+        f"id:{normalize_name(name)}": player_id for name, player_id in player_ids.items()
+    })
+
+
 def search_mlb_player(player_name: str) -> Optional[int]:
     """
     Search for an MLB player by name and return their MLB ID.
@@ -42,33 +137,48 @@ def search_mlb_player(player_name: str) -> Optional[int]:
     if not player_name:
         return None
     
+    cached = _cached_player_id(player_name)
+    if cached is not _MISSING:
+        return cached
+    
     try:
         # Use MLB Stats API search endpoint
-        search_url = f"https://statsapi.mlb.com/api/v1/people/search?names={player_name}&sportIds=1&active=true"
-        response = requests.get(search_url, timeout=5)
+        response = _SESSION.get(
+            MLB_PEOPLE_SEARCH_URL,
+            params={'names': player_name, 'sportIds': 1, 'active': 'true'},
+            timeout=5
+        )
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         
+        player_id = None
         if data.get('people'):
             normalized_search = normalize_name(player_name)
             
             # Try exact match first
             for player in data['people']:
                 if normalize_name(player.get('fullName', '')) == normalized_search:
-                    return player.get('id')
-            
-            # If no exact match, return first result (usually best match)
-            if data['people']:
-                return data['people'][0].get('id')
+                    player_id = player.get('id')
+                    break
+            else:
+                # If no exact match, use first result (usually best match)
+                player_id = data['people'][0].get('id')
         
-        return None
+        _remember_player_id(player_name, player_id)
+        return player_id
         
     except Exception as e:
         logger.warning(f"Failed to search for player {player_name}: {e}")
         return None
 
 
-@lru_cache(maxsize=500)
+def _remember_player_info(player_name: str, info: Optional[Dict[str, Any]]) -> None:
+    """Record a player info lookup result, evicting the oldest entry when full."""
+    if len(_PLAYER_INFO_CACHE) >= PLAYER_INFO_CACHE_MAXSIZE:
+        del _PLAYER_INFO_CACHE[next(iter(_PLAYER_INFO_CACHE))]
+    _PLAYER_INFO_CACHE[player_name] = info
+
+
 def get_player_info(player_name: str) -> Optional[Dict[str, Any]]:
     """
     Get full player information including MLB ID and current team.
@@ -82,46 +192,40 @@ def get_player_info(player_name: str) -> Optional[Dict[str, Any]]:
     if not player_name:
         return None
     
+    cached = _PLAYER_INFO_CACHE.get(player_name, _MISSING)
+    if cached is not _MISSING:
+        return cached
+    
+    cache_key = f"info:{normalize_name(player_name)}"
+    cached = _disk_cache_get(cache_key)
+    if cached is not _MISSING:
+        _remember_player_info(player_name, cached)
+        return cached
+    
     try:
-        # Search for the player
-        search_url = f"https://statsapi.mlb.com/api/v1/people/search?names={player_name}&sportIds=1&active=true"
-        response = requests.get(search_url, timeout=5)
+        # Search with currentTeam hydrated so no follow-up detail request is needed
+        response = _SESSION.get(
+            MLB_PEOPLE_SEARCH_URL,
+            params={'names': player_name, 'sportIds': 1, 'active': 'true', 'hydrate': 'currentTeam'},
+            timeout=5
+        )
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         
         if data.get('people'):
             normalized_search = normalize_name(player_name)
             
-            # Try exact match first
-            for player in data['people']:
-                if normalize_name(player.get('fullName', '')) == normalized_search:
-                    player_id = player.get('id')
-                    if player_id:
-                        # Get detailed info
-                        detail_url = f"https://statsapi.mlb.com/api/v1/people/{player_id}?hydrate=currentTeam"
-                        detail_response = requests.get(detail_url, timeout=5)
-                        detail_response.raise_for_status()
-                        detail_data = detail_response.json()
-                        
-                        if detail_data.get('people'):
-                            return detail_data['people'][0]
-                    return player
-            
-            # If no exact match, use first result
-            if data['people']:
-                player = data['people'][0]
-                player_id = player.get('id')
-                if player_id:
-                    # Get detailed info
-                    detail_url = f"https://statsapi.mlb.com/api/v1/people/{player_id}?hydrate=currentTeam"
-                    detail_response = requests.get(detail_url, timeout=5)
-                    detail_response.raise_for_status()
-                    detail_data = detail_response.json()
-                    
-                    if detail_data.get('people'):
-                        return detail_data['people'][0]
-                return player
+            # Try exact match first, otherwise use first result
+            match = next(
+                (player for player in data['people']
+                 if normalize_name(player.get('fullName', '')) == normalized_search),
+                data['people'][0]
+            )
+            _disk_cache_set(cache_key, match)
+            _remember_player_info(player_name, match)
+            return match
         
+        _remember_player_info(player_name, None)
         return None
         
     except Exception as e:
@@ -133,13 +237,41 @@ def batch_search_players(player_names: List[str]) -> Dict[str, Optional[int]]:
     """
     Search for multiple players and return a mapping of names to MLB IDs.
     
+    All uncached names are resolved with one people/search request; names
+    without an exact match fall back to individual searches.
+    
     Args:
         player_names: List of player names to search
         
     Returns:
         Dict mapping player names to MLB IDs (or None if not found)
     """
-    results = {}
-    for name in player_names:
-        results[name] = search_mlb_player(name)
-    return results
\ No newline at end of file
+    pending = [
+        name for name in dict.fromkeys(player_names)
+        if name and _cached_player_id(name) is _MISSING
+    ]
+    
+    if pending:
+        try:
+            response = _SESSION.get(
+                MLB_PEOPLE_SEARCH_URL,
+                params={'names': ','.join(pending), 'sportIds': 1, 'active': 'true'},
+                timeout=5
+            )
+            response.raise_for_status()
+            
+            ids_by_name: Dict[str, Optional[int]] = {}
+            for player in json_loads(response.content).get('people', []):
+                ids_by_name.setdefault(normalize_name(player.get('fullName', '')), player.get('id'))
+            
+            resolved = {}
+            for name in pending:
+                player_id = ids_by_name.get(normalize_name(name))
+                if player_id is not None:
+                    resolved[name] = player_id
+            _remember_player_ids(resolved)
+                    
+        except Exception as e:
+            logger.warning(f"Batch player search failed for {len(pending)} names: {e}")
+    
+    return {name: search_mlb_player(name) for name in player_names}
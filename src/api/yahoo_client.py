@@ -2,22 +2,99 @@
 Yahoo Fantasy API client with secure authentication.
 """
 
+import json
 import logging
 import os
+import tempfile
+import threading
 import time
-from typing import Dict, List, Any, Optional
-import pandas as pd
-import yahoo_fantasy_api as yfa
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+import streamlit as st
 from yahoo_oauth import OAuth2
 
-from .base_client import BaseAPIClient
+from .base_client import BaseAPIClient, KeepAliveAdapter, _JitteredRetry
 from ..core.config import get_config
-from ..core.constants import YAHOO_FANTASY_BASE_URL, YAHOO_GAME_CODE
+from ..core.constants import (
+    YAHOO_FANTASY_BASE_URL, YAHOO_GAME_CODE, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+)
 from ..core.exceptions import YahooAPIError, AuthenticationError, ConfigurationError
 from ..models.player import Player
 from ..models.team import FantasyTeam
 from ..utils.text_utils import normalize_player_name
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime: yahoo_fantasy_api is only needed once OAuth
+    # is configured, so it stays off the app's cold-start import path
+    import yahoo_fantasy_api as yfa
+
+# Token file for OAuth loaded from Streamlit secrets, persisted between runs
+SECRETS_OAUTH_CACHE_FILE = os.path.join(tempfile.gettempdir(), 'yahoo_oauth_cache.json')
+
+
+@lru_cache(maxsize=4)
+def _read_oauth_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a token file; keyed on mtime so a rewritten file is re-read once."""
+    with open(path) as f:
+        return json.load(f)
+
+
+T = TypeVar('T')
+
+# Fragments of Yahoo's 401 body that mean the access token was rejected
+_AUTH_FAILURE_MARKERS = ('token_expired', 'token_rejected', 'Please provide valid credentials')
+
+# Shared read-only default for missing nested objects in API payloads
+_EMPTY: Dict[str, Any] = {}
+
+# Yahoo roster positions that mark a pitcher (matches notebook)
+_SP_RP_POSITIONS = frozenset(('SP', 'RP'))
+
+
+def _filter_pitchers(players: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep the players eligible at SP or RP."""
+    is_disjoint = _SP_RP_POSITIONS.isdisjoint
+    return [p for p in players if not is_disjoint(p.get('eligible_positions', ()))]
+
+
+def _fetch_waivers(league: "yfa.League", position: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Fetch a league's waiver players, optionally filtered by Yahoo position.
+    
+    Goes through yfa's paged player fetch rather than League.waivers(), which
+    memoizes on the league object for its lifetime (leagues are cached here)
+    and cannot filter by position.
+    """
+    fetch_players = getattr(league, '_fetch_players', None)
+    if fetch_players is None:
+        players = league.waivers()
+        return players if position is None else [
+            p for p in players if position in (p.get('position_type'), *p.get('eligible_positions', ()))
+        ]
+    return fetch_players('W', position=position)
+
+
+def _parse_standings(team_data: Dict[str, Any]) -> Dict[str, int]:
+    """Extract wins, losses, ties and rank from a teams() entry."""
+    standings = team_data.get('team_standings') or _EMPTY
+    outcomes = standings.get('outcome_totals') or _EMPTY
+    return {
+        'wins': int(outcomes.get('wins', 0)),
+        'losses': int(outcomes.get('losses', 0)),
+        'ties': int(outcomes.get('ties', 0)),
+        'rank': int(standings.get('rank', 0))
+    }
+
+
+class _RefreshFlight:
+    """An OAuth token refresh in progress, shared by callers waiting on it."""
+    
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: Optional[AuthenticationError] = None
+
 
 class YahooFantasyClient:
     """
@@ -30,27 +107,85 @@ class YahooFantasyClient:
     - Automatic token refresh
     """
     
+    LEAGUE_IDS_CACHE_TTL_SECONDS = 600
+    TEAMS_CACHE_TTL_SECONDS = 300
+    
     def __init__(self) -> None:
         """Initialize Yahoo Fantasy API client with secure authentication."""
         self.logger = logging.getLogger(__name__)
         self._oauth_client: Optional[OAuth2] = None
-        self._game: Optional[yfa.Game] = None
+        self._game: Optional["yfa.Game"] = None
         self._is_configured = False
         self._configuration_error: Optional[str] = None
-        self._temp_oauth_file: Optional[str] = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_in_flight: Optional[_RefreshFlight] = None
+        
+        # League membership rarely changes within a season, so league objects
+        # are kept and the per-year league ID lists are reused for a while
+        self._league_cache: Dict[str, "yfa.League"] = {}
+        # year -> (fetched_at, league IDs)
+        self._league_ids_cache: Dict[int, Tuple[float, List[str]]] = {}
+        
+        # Standings change, so league.teams() payloads expire:
+        # league_id -> (fetched_at, teams, team_key -> (teams key, team data))
+        self._teams_cache: Dict[
+            str, Tuple[float, Dict[str, Any], Dict[str, Tuple[str, Dict[str, Any]]]]
+        ] = {}
         self._initialize_oauth()
 
-    def __del__(self):
-        """Clean up temp oauth file on deletion."""
-        if self._temp_oauth_file and os.path.exists(self._temp_oauth_file):
-            try:
-                os.remove(self._temp_oauth_file)
-                self.logger.debug(f"Cleaned up temp oauth file: {self._temp_oauth_file}")
-            except:
-                pass  # Ignore cleanup errors
+    def _secrets_oauth_file(self) -> str:
+        """
+        Get the token file used when OAuth comes from Streamlit secrets.
+        
+        yahoo_oauth writes refreshed tokens back to this file, and it is kept
+        across client constructions and restarts, so a still-valid token is
+        reused instead of refreshed. It is rewritten from secrets when missing
+        or when the secrets belong to a different app or refresh token.
+        
+        Returns:
+            Path to the token file
+        """
+        secrets = st.secrets['yahoo_oauth']
+        identity = (secrets['client_id'], secrets['refresh_token'])
+        
+        try:
+            cached = _read_oauth_file(
+                SECRETS_OAUTH_CACHE_FILE, os.stat(SECRETS_OAUTH_CACHE_FILE).st_mtime_ns
+            )
+            if (cached.get('consumer_key'), cached.get('refresh_token')) == identity:
+                return SECRETS_OAUTH_CACHE_FILE
+        except (OSError, ValueError):
+            pass
+        
+        # The tokens in secrets are static, so mark the access token as expired
+        # to force one refresh on first use
+        oauth_data = {
+            'consumer_key': secrets['client_id'],
+            'consumer_secret': secrets['client_secret'],
+            'access_token': secrets.get('access_token', 'dummy_expired_token'),
+            'refresh_token': secrets['refresh_token'],
+            'token_time': time.time() - 7200,  # 2 hours ago - definitely expired
+            'token_type': 'bearer',
+            'expires_in': 3600,  # Valid for 1 hour
+            'guid': None
+        }
+        
+        # Write a private (0600) sibling and swap it in, so a crash mid-write
+        # never leaves a truncated token file or a stray temp file behind
+        fd, tmp_path = tempfile.mkstemp(suffix='.json', dir=os.path.dirname(SECRETS_OAUTH_CACHE_FILE))
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(oauth_data, f)
+            os.replace(tmp_path, SECRETS_OAUTH_CACHE_FILE)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        
+        return SECRETS_OAUTH_CACHE_FILE
     
     def _initialize_oauth(self) -> None:
         """Initialize OAuth client using the original yahoo_oauth library."""
+        self.clear_cache()
         try:
             # Try to load from file first (for local development)
             try:
@@ -58,45 +193,10 @@ class YahooFantasyClient:
                 self.logger.info("Loaded OAuth from yahoo_oauth.json file")
             except:
                 # If file doesn't exist, try loading from Streamlit secrets (for deployment)
-                import streamlit as st
                 if hasattr(st, 'secrets') and 'yahoo_oauth' in st.secrets:
-                    # Create a temporary JSON file from secrets
-                    import json
-                    import tempfile
-                    import os
-
-                    import time
-
-                    # Set token as expired to force immediate refresh
-                    # The tokens in secrets are static and always expired
-                    oauth_data = {
-                        'consumer_key': st.secrets['yahoo_oauth']['client_id'],
-                        'consumer_secret': st.secrets['yahoo_oauth']['client_secret'],
-                        'access_token': st.secrets['yahoo_oauth'].get('access_token', 'dummy_expired_token'),
-                        'refresh_token': st.secrets['yahoo_oauth']['refresh_token'],
-                        'token_time': time.time() - 7200,  # 2 hours ago - definitely expired
-                        'token_type': 'bearer',
-                        'expires_in': 3600,  # Valid for 1 hour
-                        'guid': None
-                    }
-
-                    # Write to temp file - DON'T delete it immediately!
-                    # yahoo_oauth needs to write refreshed tokens back to this file
-                    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                        json.dump(oauth_data, f)
-                        temp_file = f.name
-
-                    # Store the temp file path so we can clean it up later
-                    self._temp_oauth_file = temp_file
-
-                    try:
-                        self._oauth_client = OAuth2(None, None, from_file=temp_file)
-                        self.logger.info(f"Loaded OAuth from Streamlit secrets (temp file: {temp_file})")
-                    except Exception as e:
-                        # Clean up on error
-                        if os.path.exists(temp_file):
-                            os.remove(temp_file)
-                        raise
+                    oauth_file = self._secrets_oauth_file()
+                    self._oauth_client = OAuth2(None, None, from_file=oauth_file)
+                    self.logger.info(f"Loaded OAuth from Streamlit secrets (token file: {oauth_file})")
                 else:
                     raise Exception("No OAuth configuration found (neither file nor secrets)")
 
@@ -107,20 +207,15 @@ class YahooFantasyClient:
                     self._oauth_client.refresh_access_token()
                     self.logger.info("Token refreshed successfully")
                 else:
-                    # Double-check by trying to refresh anyway if we're using secrets
-                    # (since the token from secrets is always expired)
-                    import streamlit as st
-                    if hasattr(st, 'secrets') and 'yahoo_oauth' in st.secrets:
-                        self.logger.info("Using Streamlit secrets - forcing token refresh...")
-                        self._oauth_client.refresh_access_token()
-                        self.logger.info("Token refreshed successfully")
-                    else:
-                        self.logger.info("Token is valid, no refresh needed")
+                    self.logger.info("Token is valid, no refresh needed")
             except Exception as refresh_error:
                 self.logger.error(f"Token refresh failed: {refresh_error}")
                 raise AuthenticationError(f"Failed to refresh OAuth token: {str(refresh_error)}")
 
+            self._pool_oauth_session()
+
             # Initialize game object with the OAuth client
+            import yahoo_fantasy_api as yfa
             self._game = yfa.Game(self._oauth_client, YAHOO_GAME_CODE)
             self._is_configured = True
 
@@ -139,8 +234,14 @@ class YahooFantasyClient:
         """Get configuration error message if any."""
         return self._configuration_error
     
-    def _ensure_authenticated(self) -> None:
-        """Ensure OAuth token is valid, refresh if necessary."""
+    def _ensure_authenticated(self, force_refresh: bool = False) -> None:
+        """
+        Ensure OAuth token is valid, refresh if necessary.
+        
+        Args:
+            force_refresh: Refresh even if the token looks valid locally,
+                e.g. after Yahoo rejected it with a 401
+        """
         if not self._is_configured:
             raise AuthenticationError(
                 self._configuration_error or "Yahoo OAuth not configured"
@@ -149,14 +250,124 @@ class YahooFantasyClient:
         if not self._oauth_client:
             raise AuthenticationError("OAuth client not initialized")
         
-        if not self._oauth_client.token_is_valid():
-            try:
-                self.logger.info("Refreshing expired OAuth token")
-                self._oauth_client.refresh_access_token()
-            except Exception as e:
-                raise AuthenticationError(f"Failed to refresh OAuth token: {str(e)}")
+        if not force_refresh and self._oauth_client.token_is_valid():
+            return
+        
+        # Single-flight refresh: the first caller refreshes, concurrent
+        # callers wait on it and share its outcome instead of re-trying
+        with self._refresh_lock:
+            if not force_refresh and self._oauth_client.token_is_valid():
+                return
+            flight = self._refresh_in_flight
+            is_leader = flight is None
+            if is_leader:
+                flight = self._refresh_in_flight = _RefreshFlight()
+        
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return
+        
+        try:
+            self.logger.info("Refreshing expired OAuth token")
+            self._oauth_client.refresh_access_token()
+            self._pool_oauth_session()
+        except Exception as e:
+            self.clear_cache()
+            flight.error = AuthenticationError(f"Failed to refresh OAuth token: {str(e)}")
+            raise flight.error
+        finally:
+            with self._refresh_lock:
+                self._refresh_in_flight = None
+            flight.done.set()
+    
+    def _with_reauth(self, call: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a yfa API call, retrying once with a fresh token if Yahoo answers 401.
+        
+        The local expiry check can't see tokens revoked or expired early on
+        Yahoo's side; yfa surfaces those as a RuntimeError carrying the body.
+        """
+        try:
+            return call(*args, **kwargs)
+        except RuntimeError as e:
+            if not any(marker in str(e) for marker in _AUTH_FAILURE_MARKERS):
+                raise
+            self.logger.info("Yahoo rejected the OAuth token; refreshing and retrying")
+            self._ensure_authenticated(force_refresh=True)
+            return call(*args, **kwargs)
     
-    def get_league(self, league_id: str) -> Optional[yfa.League]:
+    def _pool_oauth_session(self) -> None:
+        """
+        Mount a sized keep-alive pool on the OAuth session used by yfa.
+        
+        yahoo_oauth builds a fresh requests session on every token refresh,
+        so this runs after each refresh; an already-pooled session is left alone.
+        """
+        session = getattr(self._oauth_client, 'session', None)
+        if session is None or isinstance(session.get_adapter('https://'), KeepAliveAdapter):
+            return
+        
+        # Yahoo rate-limits aggressively: back off with jitter (honouring
+        # Retry-After) on 429/5xx before yfa ever sees the failure
+        session.mount('https://', KeepAliveAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=_JitteredRetry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        ))
+    
+    def clear_cache(self) -> None:
+        """Clear the cached league objects, league ID lists, and teams."""
+        self._league_cache.clear()
+        self._league_ids_cache.clear()
+        self._teams_cache.clear()
+    
+    def _get_league_ids(self, year: int, refresh: bool = False) -> List[str]:
+        """Get the user's league IDs for a season, reused for LEAGUE_IDS_CACHE_TTL_SECONDS."""
+        cached = self._league_ids_cache.get(year)
+        if (not refresh and cached and
+                time.monotonic() - cached[0] < self.LEAGUE_IDS_CACHE_TTL_SECONDS):
+            return cached[1]
+        
+        league_ids = self._with_reauth(self._game.league_ids, year=year)
+        self._league_ids_cache[year] = (time.monotonic(), league_ids)
+        return league_ids
+    
+    def _get_teams_entry(
+        self, league: "yfa.League"
+    ) -> Tuple[float, Dict[str, Any], Dict[str, Tuple[str, Dict[str, Any]]]]:
+        """Get the cached teams() payload and its team_key index for a league."""
+        cached = self._teams_cache.get(league.league_id)
+        if cached and time.monotonic() - cached[0] < self.TEAMS_CACHE_TTL_SECONDS:
+            return cached
+        
+        teams = self._with_reauth(league.teams)
+        by_team_key = {
+            team_data.get('team_key'): (team_id, team_data)
+            for team_id, team_data in teams.items()
+        }
+        cached = (time.monotonic(), teams, by_team_key)
+        self._teams_cache[league.league_id] = cached
+        return cached
+    
+    def _get_teams(self, league: "yfa.League") -> Dict[str, Any]:
+        """Get league.teams(), reusing the response for TEAMS_CACHE_TTL_SECONDS."""
+        return self._get_teams_entry(league)[1]
+    
+    def _find_team(
+        self, league: "yfa.League", team_key: str
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Look up (teams key, team data) for a team key, or None if not in the league."""
+        return self._get_teams_entry(league)[2].get(team_key)
+    
+    def get_league(self, league_id: str) -> Optional["yfa.League"]:
         """
         Get Yahoo Fantasy league object.
 
@@ -172,15 +383,21 @@ class YahooFantasyClient:
         try:
             self._ensure_authenticated()
 
+            league = self._league_cache.get(league_id)
+            if league is not None:
+                return league
+
             if not self._game:
                 raise YahooAPIError("Game object not initialized")
 
             # Get available league IDs for current year
-            from datetime import date
             current_year = date.today().year
 
             try:
-                league_ids = self._game.league_ids(year=current_year)
+                league_ids = self._get_league_ids(current_year)
+                if league_id not in league_ids:
+                    # The user may have joined the league since the list was cached
+                    league_ids = self._get_league_ids(current_year, refresh=True)
             except Exception as league_error:
                 # Log the full error for debugging
                 self.logger.error(f"Failed to get league IDs: {league_error}")
@@ -197,6 +414,7 @@ class YahooFantasyClient:
                 )
 
             league = self._game.to_league(league_id)
+            self._league_cache[league_id] = league
             self.logger.info(f"Successfully retrieved league {league_id}")
             return league
 
@@ -229,7 +447,7 @@ class YahooFantasyClient:
             if not league:
                 raise YahooAPIError(f"Could not retrieve league {league_id}")
 
-            teams_data = league.teams()
+            teams_data = self._get_teams(league)
             teams_dict = {}
 
             for team_key, team_info in teams_data.items():
@@ -246,65 +464,87 @@ class YahooFantasyClient:
                 raise
             raise YahooAPIError(f"Failed to get teams for league {league_id}: {str(e)}")
     
-    def get_waiver_pitchers(self, league: yfa.League) -> List[Player]:
+    def iter_waiver_pitchers(self, league: "yfa.League") -> Iterator[Player]:
         """
-        Get pitchers available on waiver wire.
+        Get pitchers available on waiver wire as a lazy iterator.
         
-        This method replicates the notebook's waiver pitcher retrieval logic.
+        The waiver list is fetched up front (so API errors surface here), but
+        Player objects are only built as the caller consumes them, letting
+        callers that stop early skip building the rest.
         
         Args:
             league: Yahoo Fantasy League object
             
         Returns:
-            List of Player objects for pitchers on waivers
+            Iterator of Player objects for pitchers on waivers
             
         Raises:
             YahooAPIError: If waiver data retrieval fails
         """
         try:
-            self.logger.info("Fetching waiver players...")
+            self.logger.info("Fetching waiver pitchers...")
             
-            waiver_players = league.waivers()
+            # Yahoo filters to pitchers server-side, so only their pages are fetched
+            waiver_players = self._with_reauth(_fetch_waivers, league, position='P')
             
             if not waiver_players:
                 self.logger.warning("No players found on waivers")
-                return []
+                return iter(())
             
-            # Convert to DataFrame for processing (matches notebook)
-            df = pd.DataFrame(waiver_players)
-            self.logger.info(f"Retrieved {len(df)} players from waivers")
+            self.logger.info(f"Retrieved {len(waiver_players)} pitchers from waivers")
             
-            # Filter for pitchers
-            pitchers_df = df[df['eligible_positions'].apply(
-                lambda x: any(pos in ['SP', 'RP'] for pos in x)
-            )]
+            # Keep SP/RP-eligible players
+            pitchers_raw = _filter_pitchers(waiver_players)
             
-            self.logger.info(f"Found {len(pitchers_df)} pitchers on waivers")
+            self.logger.info(f"Found {len(pitchers_raw)} pitchers on waivers")
             
-            # Convert to Player objects
-            pitchers = []
-            for _, row in pitchers_df.iterrows():
-                try:
-                    player = Player(
-                        name=row['name'],
-                        yahoo_player_id=row.get('player_id'),
-                        eligible_positions=row.get('eligible_positions', []),
-                        percent_owned=float(row.get('percent_owned', 0)),
-                        source="Waiver"
-                    )
-                    pitchers.append(player)
-                except Exception as e:
-                    self.logger.warning(f"Failed to create Player object for {row.get('name', 'Unknown')}: {e}")
-                    continue
-            
-            return pitchers
+            # Convert to Player objects on demand
+            return self._iter_players(pitchers_raw, "Waiver")
             
         except Exception as e:
             if isinstance(e, YahooAPIError):
                 raise
             raise YahooAPIError(f"Failed to fetch waiver pitchers: {str(e)}")
     
-    def get_team_pitchers(self, league: yfa.League, team_key: str) -> List[Player]:
+    def get_waiver_pitchers(self, league: "yfa.League") -> List[Player]:
+        """
+        Get pitchers available on waiver wire.
+        
+        This method replicates the notebook's waiver pitcher retrieval logic.
+        
+        Args:
+            league: Yahoo Fantasy League object
+            
+        Returns:
+            List of Player objects for pitchers on waivers
+            
+        Raises:
+            YahooAPIError: If waiver data retrieval fails
+        """
+        return list(self.iter_waiver_pitchers(league))
+    
+    def _iter_players(self, players: List[Dict[str, Any]], source: str) -> Iterator[Player]:
+        """Convert raw Yahoo player dicts to Player objects, skipping invalid ones."""
+        for raw in players:
+            try:
+                player = Player(
+                    name=raw['name'],
+                    yahoo_player_id=raw.get('player_id'),
+                    eligible_positions=raw.get('eligible_positions', []),
+                    percent_owned=float(raw.get('percent_owned', 0)),
+                    source=source
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to create Player object for {raw.get('name', 'Unknown')}: {e}")
+                continue
+            yield player
+    
+    def get_team_pitchers(
+        self,
+        league: "yfa.League",
+        team_key: str,
+        day: Optional[date] = None
+    ) -> List[Player]:
         """
         Get pitchers from a specific fantasy team roster.
         
@@ -313,6 +553,7 @@ class YahooFantasyClient:
         Args:
             league: Yahoo Fantasy League object
             team_key: Yahoo Fantasy team key (e.g., "458.l.135626.t.6")
+            day: Roster date; defaults to today
             
         Returns:
             List of Player objects for pitchers on the team
@@ -323,53 +564,32 @@ class YahooFantasyClient:
         try:
             self.logger.info(f"Fetching pitchers for team key: {team_key}")
             
-            # Get all teams to find the target team
-            all_teams_dict = league.teams()
-            
-            my_team_info = None
-            for team_id, team_data in all_teams_dict.items():
-                if team_data.get('team_key') == team_key:
-                    my_team_info = team_data
-                    break
-            
-            if not my_team_info:
+            # Find the target team among the league's teams
+            found = self._find_team(league, team_key)
+            if not found:
                 raise YahooAPIError(f"Could not find team with key '{team_key}'")
             
+            my_team_info = found[1]
+            
             team_name = my_team_info.get('name', f"Team Key {team_key}")
             self.logger.info(f"Found team '{team_name}'")
             
             # Get team roster
+            import yahoo_fantasy_api as yfa
             team_obj = yfa.Team(league.sc, team_key)
-            from datetime import date
-            roster = team_obj.roster(day=date.today())
+            roster = self._with_reauth(team_obj.roster, day=day or date.today())
             
             if not roster:
                 self.logger.warning(f"No players found on roster for {team_name}")
                 return []
             
-            # Convert to DataFrame and filter for pitchers
-            df = pd.DataFrame(roster)
-            pitchers_df = df[df['eligible_positions'].apply(
-                lambda x: any(pos in ['SP', 'RP'] for pos in x)
-            )]
+            # Filter for pitchers
+            pitchers_raw = _filter_pitchers(roster)
             
-            self.logger.info(f"Found {len(pitchers_df)} pitchers on team '{team_name}'")
+            self.logger.info(f"Found {len(pitchers_raw)} pitchers on team '{team_name}'")
             
             # Convert to Player objects
-            pitchers = []
-            for _, row in pitchers_df.iterrows():
-                try:
-                    player = Player(
-                        name=row['name'],
-                        yahoo_player_id=row.get('player_id'),
-                        eligible_positions=row.get('eligible_positions', []),
-                        percent_owned=float(row.get('percent_owned', 0)),
-                        source="My Team"
-                    )
-                    pitchers.append(player)
-                except Exception as e:
-                    self.logger.warning(f"Failed to create Player object for {row.get('name', 'Unknown')}: {e}")
-                    continue
+            pitchers = list(self._iter_players(pitchers_raw, "My Team"))
             
             return pitchers
             
@@ -390,15 +610,19 @@ class YahooFantasyClient:
             Combined list of Player objects from team and waivers
         """
         try:
+            # One "today" for the whole action, even if it straddles midnight
+            today = date.today()
             league = self.get_league(league_id)
             if not league:
                 raise YahooAPIError(f"Could not retrieve league {league_id}")
             
-            # Get waiver pitchers
-            waiver_pitchers = self.get_waiver_pitchers(league)
-            
-            # Get team pitchers
-            team_pitchers = self.get_team_pitchers(league, team_key)
+            # Waiver and roster fetches are independent round-trips; run them
+            # side by side on the league's (already refreshed) session
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                waiver_future = executor.submit(self.get_waiver_pitchers, league)
+                team_future = executor.submit(self.get_team_pitchers, league, team_key, today)
+                waiver_pitchers = waiver_future.result()
+                team_pitchers = team_future.result()
             
             # Combine lists
             all_pitchers = team_pitchers + waiver_pitchers
@@ -432,34 +656,31 @@ class YahooFantasyClient:
             if not league:
                 return None
             
-            all_teams = league.teams()
-            
-            for team_id, team_data in all_teams.items():
-                if team_data.get('team_key') == team_key:
-                    return FantasyTeam(
-                        team_key=team_key,
-                        team_id=team_id,
-                        name=team_data.get('name', 'Unknown Team'),
-                        league_id=league_id,
-                        manager_name=team_data.get('manager', {}).get('nickname'),
-                        wins=int(team_data.get('team_standings', {}).get('outcome_totals', {}).get('wins', 0)),
-                        losses=int(team_data.get('team_standings', {}).get('outcome_totals', {}).get('losses', 0)),
-                        ties=int(team_data.get('team_standings', {}).get('outcome_totals', {}).get('ties', 0)),
-                        rank=int(team_data.get('team_standings', {}).get('rank', 0))
-                    )
+            found = self._find_team(league, team_key)
+            if not found:
+                return None
             
-            return None
+            team_id, team_data = found
+            return FantasyTeam(
+                team_key=team_key,
+                team_id=team_id,
+                name=team_data.get('name', 'Unknown Team'),
+                league_id=league_id,
+                manager_name=(team_data.get('manager') or _EMPTY).get('nickname'),
+                **_parse_standings(team_data)
+            )
             
         except Exception as e:
             self.logger.warning(f"Failed to get team info: {e}")
             return None
     
-    def get_team_roster(self, team_key: str) -> List[Dict[str, Any]]:
+    def get_team_roster(self, team_key: str, day: Optional[date] = None) -> List[Dict[str, Any]]:
         """
         Get all players from a specific fantasy team roster.
         
         Args:
             team_key: Yahoo Fantasy team key (e.g., "458.l.135626.t.6")
+            day: Roster date; defaults to today
             
         Returns:
             List of player dictionaries for all players on the team
@@ -480,25 +701,20 @@ class YahooFantasyClient:
             if not league:
                 raise YahooAPIError(f"Could not retrieve league {league_id}")
             
-            # Get all teams to find the target team
-            all_teams_dict = league.teams()
-            
-            my_team_info = None
-            for team_id, team_data in all_teams_dict.items():
-                if team_data.get('team_key') == team_key:
-                    my_team_info = team_data
-                    break
-            
-            if not my_team_info:
+            # Find the target team among the league's teams
+            found = self._find_team(league, team_key)
+            if not found:
                 raise YahooAPIError(f"Could not find team with key '{team_key}'")
             
+            my_team_info = found[1]
+            
             team_name = my_team_info.get('name', f"Team Key {team_key}")
             self.logger.info(f"Found team '{team_name}'")
             
             # Get team roster
+            import yahoo_fantasy_api as yfa
             team_obj = yfa.Team(league.sc, team_key)
-            from datetime import date
-            roster = team_obj.roster(day=date.today())
+            roster = self._with_reauth(team_obj.roster, day=day or date.today())
             
             if not roster:
                 self.logger.warning(f"No players found on roster for {team_name}")
@@ -541,7 +757,7 @@ class YahooFantasyClient:
             
             self.logger.info("Fetching waiver players...")
             
-            waiver_players = league.waivers()
+            waiver_players = self._with_reauth(_fetch_waivers, league)
             
             if not waiver_players:
                 self.logger.warning("No players found on waivers")
@@ -566,8 +782,13 @@ class YahooFantasyClient:
             True if user has access to the league
         """
         try:
-            league = self.get_league(league_id)
-            return league is not None
+            self._ensure_authenticated()
+            
+            if league_id in self._league_cache:
+                return True
+            
+            # Membership is all that's needed; skip building the league object
+            return league_id in self._get_league_ids(date.today().year)
         except Exception:
             return False
     
@@ -584,10 +805,96 @@ class YahooFantasyClient:
             if not self._game:
                 return []
             
-            from datetime import date
             current_year = date.today().year
-            return self._game.league_ids(year=current_year)
+            return self._get_league_ids(current_year)
             
         except Exception as e:
             self.logger.warning(f"Failed to get available leagues: {e}")
-            return []
\ No newline at end of file
+            return []
+
+
+@st.cache_resource(show_spinner=False)
+def get_yahoo_client() -> YahooFantasyClient:
+    """
+    Get the shared Yahoo Fantasy client for this process.
+
+    The client (and its OAuth session) is built once and reused across
+    Streamlit reruns and sessions. Unconfigured clients are not cached so
+    a later call can retry initialization.
+
+    Returns:
+        Configured YahooFantasyClient instance
+
+    Raises:
+        AuthenticationError: If Yahoo OAuth is not configured
+    """
+    client = YahooFantasyClient()
+    if not client.is_configured():
+        raise AuthenticationError(
+            client.get_configuration_error() or "Yahoo OAuth not configured"
+        )
+    return client
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_league_teams(league_key: str) -> Dict[str, Any]:
+    """
+    Get all teams in a league, cached for an hour per league key.
+
+    Team keys and numbers are indexed by team name up front so selecting
+    a team on later reruns is a single dictionary lookup.
+
+    Args:
+        league_key: Yahoo Fantasy league key (e.g., "458.l.135626")
+
+    Returns:
+        Dictionary with 'names' (team names in league order) and 'by_name'
+        (team name -> (team key, team number))
+    """
+    teams_dict = get_yahoo_client().get_league_teams(league_key)
+    return {
+        'names': list(teams_dict.values()),
+        'by_name': {
+            name: (team_key, team_key.rsplit('.t.', 1)[-1])
+            for team_key, name in teams_dict.items()
+        }
+    }
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_team_roster(_client: YahooFantasyClient, team_key: str) -> List[Dict[str, Any]]:
+    """
+    Get a fantasy team roster, cached for a minute per team key.
+
+    Args:
+        _client: Yahoo Fantasy client used on a cache miss (not hashed)
+        team_key: Yahoo Fantasy team key (e.g., "458.l.135626.t.6")
+
+    Returns:
+        List of player dictionaries for all players on the team
+
+    Raises:
+        YahooAPIError: If team data retrieval fails
+    """
+    return _client.get_team_roster(team_key)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_waiver_players(
+    _client: YahooFantasyClient,
+    league_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get waiver wire players, cached for a minute per league.
+
+    Args:
+        _client: Yahoo Fantasy client used on a cache miss (not hashed)
+        league_id: Optional league ID; defaults to the user's first league
+
+    Returns:
+        List of player dictionaries from waiver wire
+
+    Raises:
+        YahooAPIError: If waiver data retrieval fails
+    """
+    return _client.get_waiver_players(league_id)
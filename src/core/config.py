@@ -3,14 +3,13 @@ Configuration management for the Yahoo Fantasy Baseball application.
 """
 
 import logging
-import re
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, validator
-import streamlit as st
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Mapping, Optional, Tuple, Type, TypeVar, Union
 
 from .constants import (
-    YAHOO_LEAGUE_ID_PATTERN,
-    YAHOO_TEAM_KEY_PATTERN,
+    is_valid_league_id,
+    is_valid_team_key,
     DEFAULT_CACHE_TTL_SECONDS,
     MAX_API_RETRIES,
     API_REQUEST_TIMEOUT,
@@ -18,74 +17,117 @@ from .constants import (
 )
 from .exceptions import ConfigurationError
 
+C = TypeVar('C', bound='_ConfigSection')
 
-class YahooOAuthConfig(BaseModel):
+_VALID_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+
+
+def _check_range(name: str, value: Union[int, float], low: Union[int, float], high: Union[int, float]) -> None:
+    """Raise ValueError if a numeric setting falls outside [low, high]."""
+    if not low <= value <= high:
+        raise ValueError(f"{name} must be between {low} and {high}, got {value}")
+
+
+class _ConfigSection:
+    """Shared construction and dict conversion for the config dataclasses."""
+    
+    @classmethod
+    def from_mapping(cls: Type[C], data: Mapping[str, Any]) -> C:
+        """Build a config section from a secrets table, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+    
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Field values as a dict, built once per instance."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(frozen=True)
+class YahooOAuthConfig(_ConfigSection):
     """Yahoo OAuth configuration model."""
     
-    client_id: str = Field(..., description="Yahoo OAuth client ID")
-    client_secret: str = Field(..., description="Yahoo OAuth client secret")
-    access_token: str = Field(..., description="Yahoo OAuth access token")
-    refresh_token: str = Field(..., description="Yahoo OAuth refresh token")
+    client_id: str
+    client_secret: str
+    access_token: str
+    refresh_token: str
     
-    @validator('client_id', 'client_secret', 'access_token', 'refresh_token')
-    def validate_not_empty(cls, v: str) -> str:
-        """Ensure OAuth values are not empty."""
-        if not v or not v.strip():
-            raise ValueError("OAuth configuration values cannot be empty")
-        return v.strip()
+    def __post_init__(self) -> None:
+        """Ensure OAuth values are not empty and strip surrounding whitespace."""
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError("OAuth configuration values cannot be empty")
+            object.__setattr__(self, f.name, value.strip())
 
 
-class AppConfig(BaseModel):
+@dataclass(frozen=True)
+class AppConfig(_ConfigSection):
     """Main application configuration."""
     
     # League and team configuration
-    default_league_id: str = Field(..., description="Default Yahoo Fantasy league ID")
-    default_team_key: str = Field(..., description="Default Yahoo Fantasy team key")
+    default_league_id: str
+    default_team_key: str
     
     # API configuration
-    cache_ttl_seconds: int = Field(DEFAULT_CACHE_TTL_SECONDS, ge=60, le=86400, 
-                                  description="Cache TTL in seconds")
-    max_retries: int = Field(MAX_API_RETRIES, ge=1, le=10, 
-                           description="Maximum API retry attempts")
-    request_timeout: int = Field(API_REQUEST_TIMEOUT, ge=5, le=60, 
-                               description="API request timeout in seconds")
+    cache_ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS
+    max_retries: int = MAX_API_RETRIES
+    request_timeout: int = API_REQUEST_TIMEOUT
     
     # Analysis configuration
-    analysis_days_ahead: int = Field(10, ge=1, le=30, 
-                                   description="Days ahead to analyze")
-    ownership_threshold: float = Field(50.0, ge=0.0, le=100.0, 
-                                     description="Ownership percentage threshold")
-    
-    @validator('default_league_id')
-    def validate_league_id(cls, v: str) -> str:
-        """Validate Yahoo Fantasy league ID format."""
-        if not re.match(YAHOO_LEAGUE_ID_PATTERN, v):
-            raise ValueError(f"Invalid league ID format: {v}")
-        return v
-    
-    @validator('default_team_key')
-    def validate_team_key(cls, v: str) -> str:
-        """Validate Yahoo Fantasy team key format."""
-        if not re.match(YAHOO_TEAM_KEY_PATTERN, v):
-            raise ValueError(f"Invalid team key format: {v}")
-        return v
-
-
-class LoggingConfig(BaseModel):
+    analysis_days_ahead: int = 10
+    ownership_threshold: float = 50.0
+    
+    def __post_init__(self) -> None:
+        """Validate ID formats and numeric ranges."""
+        if not is_valid_league_id(self.default_league_id):
+            raise ValueError(f"Invalid league ID format: {self.default_league_id}")
+        if not is_valid_team_key(self.default_team_key):
+            raise ValueError(f"Invalid team key format: {self.default_team_key}")
+        
+        # Secrets may hold numbers as strings; coerce before range checks
+        for name, cast, low, high in (
+            ("cache_ttl_seconds", int, 60, 86400),
+            ("max_retries", int, 1, 10),
+            ("request_timeout", int, 5, 60),
+            ("analysis_days_ahead", int, 1, 30),
+            ("ownership_threshold", float, 0.0, 100.0),
+        ):
+            value = cast(getattr(self, name))
+            _check_range(name, value, low, high)
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class LoggingConfig(_ConfigSection):
     """Logging configuration."""
     
-    level: str = Field("INFO", description="Logging level")
-    format: str = Field("%(asctime)s - %(name)s - %(levelname)s - %(message)s", 
-                       description="Log format string")
+    level: str = "INFO"
+    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
-    @validator('level')
-    def validate_log_level(cls, v: str) -> str:
-        """Validate logging level."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
-        return v_upper
+    def __post_init__(self) -> None:
+        """Validate and normalize the logging level."""
+        if self.level in _VALID_LOG_LEVELS:
+            return
+        level_upper = self.level.upper()
+        if level_upper not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid log level: {self.level}. Must be one of {set(_VALID_LOG_LEVELS)}")
+        object.__setattr__(self, "level", level_upper)
+
+
+# Last raw secrets table and the section built from it, keyed by table name.
+# Sections are frozen, so a reload with unchanged secrets reuses them as-is.
+_loaded_sections: Dict[str, Tuple[Dict[str, Any], _ConfigSection]] = {}
+
+
+def _load_section(name: str, cls: Type[C], data: Dict[str, Any]) -> C:
+    """Build a config section, skipping validation if its secrets are unchanged."""
+    cached = _loaded_sections.get(name)
+    if cached is not None and cached[0] == data:
+        return cached[1]
+    section = cls.from_mapping(data)
+    _loaded_sections[name] = (data, section)
+    return section
 
 
 class ApplicationConfiguration:
@@ -105,6 +147,9 @@ class ApplicationConfiguration:
     
     def _load_configuration(self) -> None:
         """Load and validate configuration from Streamlit secrets."""
+        # Imported here so non-UI consumers of this module don't load Streamlit
+        import streamlit as st
+        
         try:
             # Check if secrets are available
             if not hasattr(st, 'secrets') or not st.secrets:
@@ -115,7 +160,7 @@ class ApplicationConfiguration:
                 raise ConfigurationError("Yahoo OAuth configuration missing from secrets")
             
             oauth_data = dict(st.secrets["yahoo_oauth"])
-            self._yahoo_oauth = YahooOAuthConfig(**oauth_data)
+            self._yahoo_oauth = _load_section("yahoo_oauth", YahooOAuthConfig, oauth_data)
             
             # Load app configuration
             app_data = dict(st.secrets.get("app_config", {}))
@@ -126,11 +171,11 @@ class ApplicationConfiguration:
             if "default_team_key" not in app_data:
                 app_data["default_team_key"] = "458.l.135626.t.6"  # Example default
             
-            self._app_config = AppConfig(**app_data)
+            self._app_config = _load_section("app_config", AppConfig, app_data)
             
             # Load logging configuration
             logging_data = dict(st.secrets.get("logging", {}))
-            self._logging_config = LoggingConfig(**logging_data)
+            self._logging_config = _load_section("logging", LoggingConfig, logging_data)
             
         except Exception as e:
             if isinstance(e, ConfigurationError):
@@ -160,11 +205,11 @@ class ApplicationConfiguration:
     
     def get_yahoo_oauth_dict(self) -> Dict[str, str]:
         """Get Yahoo OAuth configuration as dictionary."""
-        return self.yahoo_oauth.dict()
+        return dict(self.yahoo_oauth.as_dict)
     
     def get_app_config_dict(self) -> Dict[str, Any]:
         """Get application configuration as dictionary."""
-        return self.app_config.dict()
+        return dict(self.app_config.as_dict)
     
     def validate_league_and_team(self, league_id: str, team_key: str) -> bool:
         """
@@ -180,15 +225,14 @@ class ApplicationConfiguration:
         Raises:
             ConfigurationError: If validation fails
         """
-        if not re.match(YAHOO_LEAGUE_ID_PATTERN, league_id):
+        if not is_valid_league_id(league_id):
             raise ConfigurationError(f"Invalid league ID format: {league_id}")
         
-        if not re.match(YAHOO_TEAM_KEY_PATTERN, team_key):
+        if not is_valid_team_key(team_key):
             raise ConfigurationError(f"Invalid team key format: {team_key}")
         
         # Verify team key belongs to league
-        league_part = team_key.split('.t.')[0]
-        if league_part != league_id:
+        if not team_key.startswith(league_id + '.t.'):
             raise ConfigurationError(f"Team key {team_key} does not belong to league {league_id}")
         
         return True
@@ -207,10 +251,7 @@ class ApplicationConfiguration:
         logging.getLogger("streamlit").setLevel(logging.WARNING)
 
 
-# Global configuration instance
-_config_instance: Optional[ApplicationConfiguration] = None
-
-
+@lru_cache(maxsize=1)
 def get_config() -> ApplicationConfiguration:
     """
     Get the global configuration instance.
@@ -218,10 +259,7 @@ def get_config() -> ApplicationConfiguration:
     Returns:
         ApplicationConfiguration instance
     """
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = ApplicationConfiguration()
-    return _config_instance
+    return ApplicationConfiguration()
 
 
 def reload_config() -> ApplicationConfiguration:
@@ -231,9 +269,8 @@ def reload_config() -> ApplicationConfiguration:
     Returns:
         New ApplicationConfiguration instance
     """
-    global _config_instance
-    _config_instance = ApplicationConfiguration()
-    return _config_instance
+    get_config.cache_clear()
+    return get_config()
 
 
 # Note: AppConfig class is defined above at line 38
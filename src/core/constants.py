@@ -17,8 +17,8 @@ YAHOO_CURRENT_SEASON = 2024
 MLB_SPORT_ID = 1  # MLB sport ID in MLB Stats API
 
 # Fantasy Baseball Positions
-PITCHER_POSITIONS = {"SP", "RP", "P"}
-POSITION_PLAYERS = {"C", "CA", "1B", "2B", "3B", "SS", "OF", "LF", "CF", "RF", "DH"}
+PITCHER_POSITIONS = frozenset({"SP", "RP", "P"})
+POSITION_PLAYERS = frozenset({"C", "CA", "1B", "2B", "3B", "SS", "OF", "LF", "CF", "RF", "DH"})
 ALL_POSITIONS = PITCHER_POSITIONS | POSITION_PLAYERS
 
 # Position Display Order
@@ -34,6 +34,8 @@ DEFAULT_CACHE_TTL_SECONDS = 3600  # 1 hour
 MAX_API_RETRIES = 3
 API_REQUEST_TIMEOUT = 10
 RATE_LIMIT_DELAY = 2  # seconds between retries
+HTTP_POOL_CONNECTIONS = 20  # connection pools kept per session
+HTTP_POOL_MAXSIZE = 50  # keep-alive connections kept per pool
 
 # Second Start Analysis
 MIN_GAMES_FOR_SECOND_START = 5
@@ -87,6 +89,21 @@ YAHOO_LEAGUE_ID_PATTERN = r"^\d+\.l\.\d+$"
 YAHOO_TEAM_KEY_PATTERN = r"^\d+\.l\.\d+\.t\.\d+$"
 MLB_PLAYER_ID_PATTERN = r"^\d+$"
 
+
+def is_valid_league_id(value: str) -> bool:
+    """Check a league ID against YAHOO_LEAGUE_ID_PATTERN without the regex engine."""
+    parts = value.split('.')
+    return (len(parts) == 3 and parts[1] == 'l' and
+            parts[0].isdecimal() and parts[2].isdecimal())
+
+
+def is_valid_team_key(value: str) -> bool:
+    """Check a team key against YAHOO_TEAM_KEY_PATTERN without the regex engine."""
+    parts = value.split('.')
+    return (len(parts) == 5 and parts[1] == 'l' and parts[3] == 't' and
+            parts[0].isdecimal() and parts[2].isdecimal() and parts[4].isdecimal())
+
+
 # Default Values
 DEFAULT_OWNERSHIP_THRESHOLD = 50.0  # Percentage
 DEFAULT_ANALYSIS_DAYS_AHEAD = 10
@@ -3,14 +3,23 @@ Logging configuration for the Yahoo Fantasy Baseball application.
 """
 
 import logging
-import logging.handlers
 import sys
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
 from .config import get_config
 from .constants import LOG_FORMAT, LOG_DATE_FORMAT
 
+# Log level for API responses by status class (status_code // 100, capped at 5)
+_STATUS_LEVEL = {4: logging.WARNING, 5: logging.ERROR}
+
+
+@lru_cache(maxsize=8)
+def _get_formatter(fmt: str, datefmt: str) -> logging.Formatter:
+    """Get a shared formatter for a format/date-format pair."""
+    return logging.Formatter(fmt=fmt, datefmt=datefmt)
+
 
 def setup_logging(
     log_level: Optional[str] = None,
@@ -35,28 +44,27 @@ def setup_logging(
         log_format = logging_config.format
         
         # Configure root logger
+        level_num = getattr(logging, level.upper())
         root_logger = logging.getLogger()
-        root_logger.setLevel(getattr(logging, level.upper()))
+        root_logger.setLevel(level_num)
         
         # Clear existing handlers
         root_logger.handlers.clear()
         
-        # Create formatter
-        formatter = logging.Formatter(
-            fmt=log_format,
-            datefmt=LOG_DATE_FORMAT
-        )
+        formatter = _get_formatter(log_format, LOG_DATE_FORMAT)
         
         # Console handler
         if enable_console:
             console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(getattr(logging, level.upper()))
+            console_handler.setLevel(level_num)
             console_handler.setFormatter(formatter)
             root_logger.addHandler(console_handler)
         
         # File handler (if specified)
         if log_file:
             try:
+                import logging.handlers
+                
                 log_path = Path(log_file)
                 log_path.parent.mkdir(parents=True, exist_ok=True)
                 
@@ -65,7 +73,7 @@ def setup_logging(
                     maxBytes=10*1024*1024,  # 10MB
                     backupCount=5
                 )
-                file_handler.setLevel(getattr(logging, level.upper()))
+                file_handler.setLevel(level_num)
                 file_handler.setFormatter(formatter)
                 root_logger.addHandler(file_handler)
                 
@@ -151,16 +159,9 @@ def log_api_request(method: str, url: str, status_code: int, duration: float) ->
     """
     logger = logging.getLogger('api_requests')
     
-    level = logging.INFO
-    if status_code >= 400:
-        level = logging.WARNING
-    if status_code >= 500:
-        level = logging.ERROR
-    
-    logger.log(
-        level,
-        f"{method} {url} -> {status_code} ({duration:.2f}s)"
-    )
+    level = _STATUS_LEVEL.get(min(status_code // 100, 5), logging.INFO)
+    if logger.isEnabledFor(level):
+        logger.log(level, "%s %s -> %s (%.2fs)", method, url, status_code, duration)
 
 
 def log_cache_operation(operation: str, key: str, hit: bool = None) -> None:
@@ -173,12 +174,13 @@ def log_cache_operation(operation: str, key: str, hit: bool = None) -> None:
         hit: Whether cache hit occurred (for get operations)
     """
     logger = logging.getLogger('cache_operations')
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     
     if operation == 'get' and hit is not None:
-        result = 'HIT' if hit else 'MISS'
-        logger.debug(f"Cache {operation}: {key} -> {result}")
+        logger.debug("Cache %s: %s -> %s", operation, key, 'HIT' if hit else 'MISS')
     else:
-        logger.debug(f"Cache {operation}: {key}")
+        logger.debug("Cache %s: %s", operation, key)
 
 
 def log_analysis_step(step: str, details: str = None) -> None:
@@ -190,12 +192,13 @@ def log_analysis_step(step: str, details: str = None) -> None:
         details: Optional step details
     """
     logger = logging.getLogger('analysis')
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
-    message = f"Analysis step: {step}"
     if details:
-        message += f" - {details}"
-    
-    logger.info(message)
+        logger.info("Analysis step: %s - %s", step, details)
+    else:
+        logger.info("Analysis step: %s", step)
 
 
 def log_error_with_context(error: Exception, context: dict = None) -> None:
@@ -244,13 +247,14 @@ class StructuredLogger:
     
     def _log(self, level: int, message: str, **kwargs) -> None:
         """Internal logging method with structured data."""
+        if not self.logger.isEnabledFor(level):
+            return
+        
         if kwargs:
             structured_data = ' | '.join(f'{k}={v}' for k, v in kwargs.items())
-            full_message = f"{message} | {structured_data}"
+            self.logger.log(level, "%s | %s", message, structured_data)
         else:
-            full_message = message
-        
-        self.logger.log(level, full_message)
+            self.logger.log(level, message)
 
 
 def get_structured_logger(name: str) -> StructuredLogger:
@@ -283,16 +287,19 @@ def log_performance(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         logger = logging.getLogger('performance')
-        start_time = time.time()
-        
+        # Failures are logged at ERROR either way; only the timing of
+        # successful calls depends on INFO being enabled
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
-            logger.info(f"{func.__name__} completed in {duration:.3f}s")
-            return result
         except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"{func.__name__} failed after {duration:.3f}s: {e}")
+            duration = time.perf_counter() - start_time
+            logger.error("%s failed after %.3fs: %s", func.__name__, duration, e)
             raise
+        
+        if logger.isEnabledFor(logging.INFO):
+            duration = time.perf_counter() - start_time
+            logger.info("%s completed in %.3fs", func.__name__, duration)
+        return result
     
     return wrapper
\ No newline at end of file
@@ -5,36 +5,99 @@ This module provides a pre-built cache of common MLB players and their IDs.
 It can be used as a fallback when API lookups are slow or unavailable.
 """
 
-import json
+import atexit
 import os
+import tempfile
 from typing import Optional, Dict
 from pathlib import Path
 
+from ..utils.json_utils import json_dumps, json_loads
+
 # Cache file location
 CACHE_FILE = Path(__file__).parent / "mlb_player_ids.json"
 
+# Parsed cache shared by all lookups; re-read only when the file's mtime changes
+_CACHE: Optional[Dict[str, int]] = None
+_CACHE_MTIME: Optional[int] = None
+
+# FALLBACK_CACHE overlaid with the disk cache (disk entries win), rebuilt
+# whenever _CACHE is; kept separate so fallback entries never get saved
+_MERGED: Dict[str, int] = {}
+
+# Updates are buffered in _CACHE and written out in batches
+FLUSH_THRESHOLD = 50
+_PENDING = 0
+
+
+def _cache_file_mtime() -> Optional[int]:
+    """Get the cache file's mtime in nanoseconds, or None if it doesn't exist."""
+    try:
+        return CACHE_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 def load_player_cache() -> Dict[str, int]:
-    """Load the player ID cache from disk."""
-    if CACHE_FILE.exists():
+    """
+    Load the player ID cache from disk.
+    
+    The parsed dict is kept in memory and returned as-is while the file is
+    unchanged, so steady-state lookups cost one stat call. While updates are
+    waiting to be flushed the in-memory dict is authoritative and the file
+    isn't checked at all.
+    """
+    global _CACHE, _CACHE_MTIME, _MERGED
+    
+    if _PENDING and _CACHE is not None:
+        return _CACHE
+    
+    mtime = _cache_file_mtime()
+    if _CACHE is not None and mtime == _CACHE_MTIME:
+        return _CACHE
+    
+    cache: Dict[str, int] = {}
+    if mtime is not None:
         try:
-            with open(CACHE_FILE, 'r') as f:
-                return json.load(f)
+            cache = json_loads(CACHE_FILE.read_bytes())
         except Exception:
             pass
-    return {}
+    
+    _CACHE, _CACHE_MTIME = cache, mtime
+    _MERGED = {**FALLBACK_CACHE, **cache}
+    return cache
 
 
 def save_player_cache(cache: Dict[str, int]) -> None:
-    """Save the player ID cache to disk."""
+    """Save the player ID cache to disk, replacing the file atomically."""
+    global _CACHE, _CACHE_MTIME, _MERGED, _PENDING
     try:
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache, f, indent=2)
+        fd, tmp_path = tempfile.mkstemp(suffix='.json', dir=CACHE_FILE.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json_dumps(cache, indent=True))
+            os.replace(tmp_path, CACHE_FILE)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        # Our own write shouldn't force a re-read on the next lookup
+        if cache is not _CACHE:
+            _MERGED = {**FALLBACK_CACHE, **cache}
+        _CACHE, _CACHE_MTIME = cache, _cache_file_mtime()
+        _PENDING = 0
     except Exception:
         pass
 
 
+def flush_player_cache() -> None:
+    """Write any buffered cache updates to disk."""
+    if _PENDING and _CACHE is not None:
+        save_player_cache(_CACHE)
+
+
+atexit.register(flush_player_cache)
+
+
 def get_cached_player_id(player_name: str) -> Optional[int]:
     """
     Get a player's MLB ID from the cache.
@@ -45,21 +108,30 @@ def get_cached_player_id(player_name: str) -> Optional[int]:
     Returns:
         MLB player ID if found in cache, None otherwise
     """
-    cache = load_player_cache()
-    return cache.get(player_name)
+    return load_player_cache().get(player_name)
 
 
 def update_player_cache(player_name: str, mlb_id: int) -> None:
     """
     Update the cache with a new player ID.
     
+    The change is visible to lookups immediately but only written to disk
+    once FLUSH_THRESHOLD updates have accumulated (or at interpreter exit;
+    call flush_player_cache() to force it).
+    
     Args:
         player_name: Player's full name
         mlb_id: MLB player ID
     """
+    global _PENDING
     cache = load_player_cache()
+    if cache.get(player_name) == mlb_id:
+        return
     cache[player_name] = mlb_id
-    save_player_cache(cache)
+    _MERGED[player_name] = mlb_id
+    _PENDING += 1
+    if _PENDING >= FLUSH_THRESHOLD:
+        flush_player_cache()
 
 
 # Pre-populated cache of common 2024-2025 players
@@ -94,10 +166,6 @@ def get_player_id_with_fallback(player_name: str) -> Optional[int]:
     Returns:
         MLB player ID if found, None otherwise
     """
-    # Try disk cache first
-    mlb_id = get_cached_player_id(player_name)
-    if mlb_id:
-        return mlb_id
-    
-    # Try fallback cache
-    return FALLBACK_CACHE.get(player_name)
\ No newline at end of file
+    # Disk cache entries already override the fallback list in the merged view
+    load_player_cache()
+    return _MERGED.get(player_name)
\ No newline at end of file
@@ -6,6 +6,8 @@ from datetime import date
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 
+from ..core.constants import ALL_POSITIONS, PITCHER_POSITIONS
+
 
 class Player(BaseModel):
     """
@@ -53,11 +55,10 @@ class Player(BaseModel):
     @validator('eligible_positions')
     def validate_positions(cls, v: List[str]) -> List[str]:
         """Validate and normalize position codes."""
-        valid_positions = {'C', 'CA', '1B', '2B', '3B', 'SS', 'OF', 'LF', 'CF', 'RF', 'DH', 'SP', 'RP', 'P'}
         normalized = []
         for pos in v:
             pos_upper = pos.upper()
-            if pos_upper in valid_positions:
+            if pos_upper in ALL_POSITIONS:
                 normalized.append(pos_upper)
         return normalized
     
@@ -65,8 +66,7 @@ class Player(BaseModel):
     def determine_is_pitcher(cls, v: bool, values: Dict[str, Any]) -> bool:
         """Automatically determine if player is a pitcher based on positions."""
         if 'eligible_positions' in values:
-            pitcher_positions = {'SP', 'RP', 'P'}
-            return any(pos in pitcher_positions for pos in values['eligible_positions'])
+            return not PITCHER_POSITIONS.isdisjoint(values['eligible_positions'])
         return v
     
     @property
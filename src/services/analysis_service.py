@@ -8,7 +8,7 @@ and MLB Stats API to identify optimal Monday/Tuesday starting pitchers.
 import time
 import unicodedata
 import re
-from datetime import date, timedelta, datetime
+from datetime import date, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 import pandas as pd
 import streamlit as st
@@ -16,10 +16,11 @@ import streamlit as st
 from ..models.player import Player
 from ..models.analysis import PitcherAnalysis, FantasyWeek
 from ..models.team import FantasyTeam, MLBTeam
-from ..api.yahoo_client import YahooFantasyClient
-from ..api.mlb_client import MLBStatsClient
+from ..api.yahoo_client import YahooFantasyClient, fetch_team_roster, fetch_waiver_players
+from ..api.mlb_client import MLBStatsClient, fetch_probable_starters
 from ..api.mlb_player_lookup import search_mlb_player
 from ..data.mlb_player_cache import get_player_id_with_fallback, update_player_cache
+from ..core.constants import PITCHER_POSITIONS
 from ..core.exceptions import AnalysisError, APIError
 from ..utils.text_utils import slugify
 from ..utils.url_utils import create_baseball_savant_url
@@ -101,7 +102,7 @@ class AnalysisService:
             List of Player objects representing the team roster
         """
         try:
-            roster_data = self.yahoo_client.get_team_roster(team_key)
+            roster_data = fetch_team_roster(self.yahoo_client, team_key)
             players = []
             
             for player_data in roster_data:
@@ -158,7 +159,7 @@ class AnalysisService:
     def _get_waiver_pitchers(self) -> List[Player]:
         """Get pitcher data from waiver wire."""
         try:
-            waiver_data = self.yahoo_client.get_waiver_players()
+            waiver_data = fetch_waiver_players(self.yahoo_client)
             pitchers = []
             
             for player_data in waiver_data:
@@ -182,7 +183,7 @@ class AnalysisService:
     def _get_my_team_pitchers(self, team_key: str) -> List[Player]:
         """Get pitcher data from user's team."""
         try:
-            roster_data = self.yahoo_client.get_team_roster(team_key)
+            roster_data = fetch_team_roster(self.yahoo_client, team_key)
             pitchers = []
             
             for player_data in roster_data:
@@ -205,8 +206,7 @@ class AnalysisService:
     
     def _is_pitcher(self, positions: List[str]) -> bool:
         """Check if player is a pitcher based on eligible positions."""
-        pitcher_positions = {'SP', 'RP', 'P'}
-        return any(pos in pitcher_positions for pos in positions)
+        return not PITCHER_POSITIONS.isdisjoint(positions)
     
     def _combine_pitcher_data(self, waiver_pitchers: List[Player], my_team_pitchers: List[Player]) -> List[Player]:
         """Combine waiver and team pitcher data."""
@@ -218,37 +218,17 @@ class AnalysisService:
     def _get_confirmed_probable_starters(self, fantasy_week: FantasyWeek) -> Dict[int, Dict[str, Any]]:
         """Get confirmed probable starters from MLB API."""
         try:
-            start_date_str = fantasy_week.start_date.isoformat()
-            end_date_str = (fantasy_week.start_date + timedelta(days=10)).isoformat()
-            
-            schedule_data = self.mlb_client.get_probable_pitchers(start_date_str, end_date_str)
-            confirmed_starters = {}
-            
-            if schedule_data and schedule_data.get('dates'):
-                for day in schedule_data['dates']:
-                    game_date = datetime.strptime(day['date'], '%Y-%m-%d').date()
-                    
-                    if fantasy_week.start_date <= game_date <= fantasy_week.end_date:
-                        for game in day.get('games', []):
-                            for team_key in ['home', 'away']:
-                                probable = game.get('teams', {}).get(team_key, {}).get('probablePitcher')
-                                team_info = game.get('teams', {}).get(team_key, {}).get('team')
-                                
-                                if (probable and 'id' in probable and 'fullName' in probable 
-                                    and team_info and 'id' in team_info):
-                                    
-                                    pid = probable['id']
-                                    pname = probable['fullName']
-                                    tid = team_info['id']
-                                    
-                                    if pid not in confirmed_starters:
-                                        confirmed_starters[pid] = {
-                                            'name': pname,
-                                            'date': game_date,
-                                            'team_id': tid
-                                        }
+            starters = fetch_probable_starters(
+                self.mlb_client,
+                fantasy_week.start_date,
+                fantasy_week.start_date + timedelta(days=10)
+            )
             
-            return confirmed_starters
+            # Starters are keyed by pitcher with their earliest start in range
+            return {
+                pid: info for pid, info in starters.items()
+                if fantasy_week.start_date <= info['date'] <= fantasy_week.end_date
+            }
             
         except Exception as e:
             st.warning(f"Could not fetch probable starters: {str(e)}")
@@ -267,6 +247,17 @@ class AnalysisService:
         monday_date = fantasy_week.start_date
         tuesday_date = fantasy_week.start_date + timedelta(days=1)
         
+        # Warm the schedule cache for every starting team in parallel; the
+        # range matches what _check_potential_second_start asks for
+        self.mlb_client.get_team_schedules_bulk(
+            [
+                info['team_id'] for info in confirmed_starters.values()
+                if info['date'] in (monday_date, tuesday_date)
+            ],
+            fantasy_week.start_date,
+            fantasy_week.end_date + timedelta(days=5)
+        )
+        
         for mlb_api_id, starter_info in confirmed_starters.items():
             # Filter for Monday/Tuesday starts only
             if starter_info['date'] in [monday_date, tuesday_date]:
@@ -278,7 +269,8 @@ class AnalysisService:
                     potential_second = self._check_potential_second_start(
                         starter_info['team_id'], 
                         starter_info['date'], 
-                        fantasy_week.end_date
+                        fantasy_week.end_date,
+                        fantasy_week.start_date
                     )
                     
                     # Create Baseball Savant URL
@@ -316,24 +308,35 @@ class AnalysisService:
         
         return None
     
-    def _check_potential_second_start(self, team_id: int, first_start_date: date, fantasy_week_end: date) -> bool:
+    def _check_potential_second_start(
+        self,
+        team_id: int,
+        first_start_date: date,
+        fantasy_week_end: date,
+        fantasy_week_start: date
+    ) -> bool:
         """Check if pitcher has potential for second start based on team schedule.
 
         This matches the logic from assistantbeta.ipynb:
         - Look at games starting day after first start
         - Check 5 days beyond fantasy week end to catch team's 5th game
         - If team has 5+ games and the 5th game is within fantasy week, likely second start
+
+        The schedule is fetched for the whole fantasy week and trimmed here, so
+        pitchers on the same team reuse one cached schedule request.
         """
         try:
-            # Match the working script's logic exactly
-            schedule_start = first_start_date + timedelta(days=1)  # Day after first start
             schedule_end = fantasy_week_end + timedelta(days=5)  # Look 5 days beyond week end
 
-            game_dates = self.mlb_client.get_team_schedule(
-                team_id,
-                schedule_start,
-                schedule_end
-            )
+            # Games after the first start (day after onward)
+            game_dates = [
+                game_date for game_date in self.mlb_client.get_team_schedule(
+                    team_id,
+                    min(fantasy_week_start, first_start_date + timedelta(days=1)),
+                    schedule_end
+                )
+                if game_date > first_start_date
+            ]
 
             # If team has 5+ games after the first start, check if 5th game is within fantasy week
             if len(game_dates) >= 5:
@@ -99,17 +99,21 @@ def _render_enhanced_team_id_section() -> Optional[str]:
 
         # Try to fetch teams from the league
         try:
-            from ...api.yahoo_client import YahooFantasyClient
-            client = YahooFantasyClient()
+            from ...api.yahoo_client import fetch_league_teams
+            from ...core.exceptions import AuthenticationError
 
-            if client.is_configured():
-                # Get teams from the league
-                teams_dict = client.get_league_teams(full_league_key)
-
-                if teams_dict:
+            try:
+                # Cached per league key and already indexed by team name
+                teams_index = fetch_league_teams(full_league_key)
+            except AuthenticationError:
+                teams_index = None
+
+            if teams_index is not None:
+                by_name = teams_index['by_name']
+                if by_name:
                     # Create dropdown with team names
-                    team_options = ["Select your team..."] + [f"{name}" for name in teams_dict.values()]
-                    team_keys_list = [""] + list(teams_dict.keys())
+                    team_options = ["Select your team..."] + teams_index['names']
+                    team_keys_list = [""] + [by_name[name][0] for name in teams_index['names']]
 
                     # Get the index of the currently selected team if any
                     selected_index = 0
@@ -127,9 +131,7 @@ def _render_enhanced_team_id_section() -> Optional[str]:
                     )
 
                     if selected_team != "Select your team...":
-                        # Find the team key for the selected team name
-                        selected_idx = team_options.index(selected_team)
-                        team_key = team_keys_list[selected_idx]
+                        team_key = by_name[selected_team][0]
                         st.session_state['team_key'] = team_key
                         st.session_state['selected_team_key'] = team_key
                         st.sidebar.success(f"✅ Team selected: **{selected_team}**")
@@ -5,6 +5,8 @@ Provides automatic dark mode detection, mobile-first responsive design,
 and improved accessibility for Yahoo Fantasy Baseball Streamlit application.
 """
 
+from functools import lru_cache
+
 import streamlit as st
 
 
@@ -18,8 +20,12 @@ def apply_enhanced_css() -> None:
     """, unsafe_allow_html=True)
 
 
+@lru_cache(maxsize=1)
 def get_enhanced_css() -> str:
-    """Return comprehensive CSS with dark mode and mobile optimization."""
+    """Return comprehensive CSS with dark mode and mobile optimization.
+
+    The stylesheet is static, so it is assembled once per process.
+    """
     return f"""
     <style>
     {get_enhanced_base_styles()}
@@ -11,13 +11,14 @@ from datetime import date, timedelta
 
 from ...models.analysis import PitcherAnalysis, FantasyWeek
 from ...services.analysis_service import AnalysisService
-from ...api.yahoo_client import YahooFantasyClient
-from ...api.mlb_client import MLBStatsClient
+from ...api.yahoo_client import get_yahoo_client
+from ...api.mlb_client import get_mlb_client
 from ...services.cache_service import CacheService
 from ...core.exceptions import AnalysisError, APIError
 # Removed sidebar import - using session state directly
 
 
+@st.fragment
 def render_enhanced_analysis_tab() -> None:
     """Render enhanced analysis tab with pitcher cards and profile images."""
     # Simple plain header - h3 is smaller than main title
@@ -86,8 +87,8 @@ def _run_enhanced_analysis(team_key: str, settings: Dict[str, Any]) -> None:
     try:
         with st.spinner("⚾ Analyzing starting pitchers..."):
             # Initialize services
-            yahoo_client = YahooFantasyClient()
-            mlb_client = MLBStatsClient()
+            yahoo_client = get_yahoo_client()
+            mlb_client = get_mlb_client()
             cache_service = CacheService()
             analysis_service = AnalysisService(yahoo_client, mlb_client, cache_service)
             
@@ -12,13 +12,14 @@ import requests
 
 from ...models.player import Player
 from ...services.analysis_service import AnalysisService
-from ...api.yahoo_client import YahooFantasyClient
-from ...api.mlb_client import MLBStatsClient
+from ...api.yahoo_client import get_yahoo_client
+from ...api.mlb_client import get_mlb_client
 from ...services.cache_service import CacheService
 from ...core.exceptions import AnalysisError, APIError
 # Removed sidebar import - using session state directly
 
 
+@st.fragment
 def render_enhanced_roster_tab() -> None:
     """Render the enhanced roster tab with player cards and images."""
     # Simple plain header - h3 is smaller than main title
@@ -99,8 +100,8 @@ def _load_enhanced_roster_data(team_key: str) -> None:
     try:
         with st.spinner("⚾ Loading your team roster..."):
             # Initialize services
-            yahoo_client = YahooFantasyClient()
-            mlb_client = MLBStatsClient()
+            yahoo_client = get_yahoo_client()
+            mlb_client = get_mlb_client()
             cache_service = CacheService()
             analysis_service = AnalysisService(yahoo_client, mlb_client, cache_service)
             
@@ -48,6 +48,8 @@ from .date_utils import (
     get_business_days_between
 )
 
+from .json_utils import json_dumps, json_loads
+
 __all__ = [
     # Text utilities
     "slugify",
@@ -90,5 +92,9 @@ __all__ = [
     "get_week_dates_list",
     "parse_date_string",
     "get_relative_date_description",
-    "get_business_days_between"
+    "get_business_days_between",
+    
+    # JSON utilities
+    "json_dumps",
+    "json_loads"
 ]
\ No newline at end of file
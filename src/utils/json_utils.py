@@ -0,0 +1,50 @@
+"""
+JSON encoding and decoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document.
+    
+    Args:
+        data: Raw JSON bytes or text (e.g., ``response.content``)
+        
+    Returns:
+        Decoded Python object
+        
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON.
+    
+    Args:
+        obj: JSON-serializable object (e.g., a request body)
+        indent: Pretty-print with two-space indentation instead of
+            compact separators (for files meant to be read by people)
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')